@@ -22,6 +22,7 @@ usage() {
     echo ""
     echo "Options:"
     echo "  --skip-slow       Skip tests marked as 'slow', 'real_api', or 'mcp_resources'"
+    echo "  --parallel        Run test files in parallel worker processes (pytest-xdist)"
     echo "  -v, --verbose     Run pytest in verbose mode"
     echo "  -h, --help        Show this help message"
     echo ""
@@ -29,6 +30,7 @@ usage() {
     echo "  $0                    # Run all tests (including slow real API tests)"
     echo "  $0 --skip-slow        # Run only fast mock tests"
     echo "  $0 --skip-slow -v     # Run fast tests with verbose output"
+    echo "  $0 --parallel         # Run all tests, one worker per CPU core"
     exit 0
 }
 
@@ -36,6 +38,7 @@ usage() {
 PYTEST_VERBOSE=""
 PYTEST_LOG=""
 SKIP_SLOW=false
+PARALLEL=false
 PYTEST_ARGS=()
 
 for arg in "$@"; do
@@ -47,6 +50,10 @@ for arg in "$@"; do
             SKIP_SLOW=true
             shift
             ;;
+        --parallel)
+            PARALLEL=true
+            shift
+            ;;
         -v|--verbose)
             PYTEST_VERBOSE="--verbose"
             PYTEST_LOG="-o log_cli_level=INFO --log-cli-level=INFO"
@@ -76,6 +83,12 @@ else
     echo "Running ALL tests (including slow real API tests)"
 fi
 
+# Distribute whole files to workers so module-scoped fixtures are built once
+if [ "$PARALLEL" = true ]; then
+    PYTEST_CMD+=(-n auto --dist=loadfile)
+    echo "Running test files in parallel (pytest-xdist)"
+fi
+
 # Add verbose and logging flags
 if [ -n "$PYTEST_VERBOSE" ]; then
     PYTEST_CMD+=($PYTEST_VERBOSE)
@@ -43,9 +43,9 @@ class CacheMixin:
         is_expired = time_since_fetch >= self._cache_duration
         
         if is_expired:
-            logger.info(f"Cache expired ({time_since_fetch.total_seconds():.1f}s since last fetch)")
+            logger.info("Cache expired (%.1fs since last fetch)", time_since_fetch.total_seconds())
         else:
-            logger.debug(f"Using cached data ({time_since_fetch.total_seconds():.1f}s old)")
+            logger.debug("Using cached data (%.1fs old)", time_since_fetch.total_seconds())
         
         return is_expired
     
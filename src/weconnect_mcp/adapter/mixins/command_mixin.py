@@ -52,10 +52,10 @@ class CommandMixin:
         try:
             vehicle.doors.commands.commands["lock-unlock"].value = LockUnlockCommand.Command.LOCK
             self.invalidate_cache()
-            logger.info(f"Vehicle {vehicle_id} locked successfully, cache invalidated")
+            logger.info("Vehicle %s locked successfully, cache invalidated", vehicle_id)
             return {"success": True, "message": "Vehicle locked"}
         except Exception as e:
-            logger.error(f"Failed to lock vehicle {vehicle_id}: {e}")
+            logger.error("Failed to lock vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def unlock_vehicle(self, vehicle_id: str) -> dict[str, Any]:
@@ -80,10 +80,10 @@ class CommandMixin:
         try:
             vehicle.doors.commands.commands["lock-unlock"].value = LockUnlockCommand.Command.UNLOCK
             self.invalidate_cache()
-            logger.info(f"Vehicle {vehicle_id} unlocked successfully, cache invalidated")
+            logger.info("Vehicle %s unlocked successfully, cache invalidated", vehicle_id)
             return {"success": True, "message": "Vehicle unlocked"}
         except Exception as e:
-            logger.error(f"Failed to unlock vehicle {vehicle_id}: {e}")
+            logger.error("Failed to unlock vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def start_climatization(self, vehicle_id: str, target_temp_celsius: Optional[float] = None) -> dict[str, Any]:
@@ -115,10 +115,10 @@ class CommandMixin:
             
             vehicle.climatization.commands.commands["start-stop"].value = command_dict
             self.invalidate_cache()
-            logger.info(f"Climatization started for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Climatization started for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Climatization started"}
         except Exception as e:
-            logger.error(f"Failed to start climatization for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to start climatization for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def stop_climatization(self, vehicle_id: str) -> dict[str, Any]:
@@ -143,10 +143,10 @@ class CommandMixin:
         try:
             vehicle.climatization.commands.commands["start-stop"].value = ClimatizationStartStopCommand.Command.STOP
             self.invalidate_cache()
-            logger.info(f"Climatization stopped for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Climatization stopped for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Climatization stopped"}
         except Exception as e:
-            logger.error(f"Failed to stop climatization for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to stop climatization for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def start_charging(self, vehicle_id: str) -> dict[str, Any]:
@@ -171,10 +171,10 @@ class CommandMixin:
         try:
             vehicle.charging.commands.commands["start-stop"].value = ChargingStartStopCommand.Command.START
             self.invalidate_cache()
-            logger.info(f"Charging started for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Charging started for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Charging started"}
         except Exception as e:
-            logger.error(f"Failed to start charging for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to start charging for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def stop_charging(self, vehicle_id: str) -> dict[str, Any]:
@@ -199,10 +199,10 @@ class CommandMixin:
         try:
             vehicle.charging.commands.commands["start-stop"].value = ChargingStartStopCommand.Command.STOP
             self.invalidate_cache()
-            logger.info(f"Charging stopped for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Charging stopped for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Charging stopped"}
         except Exception as e:
-            logger.error(f"Failed to stop charging for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to stop charging for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def flash_lights(self, vehicle_id: str, duration_seconds: Optional[int] = None) -> dict[str, Any]:
@@ -233,10 +233,10 @@ class CommandMixin:
             
             vehicle.controls.commands.commands["honk-and-flash"].value = command_dict
             self.invalidate_cache()
-            logger.info(f"Lights flashed for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Lights flashed for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Lights flashed"}
         except Exception as e:
-            logger.error(f"Failed to flash lights for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to flash lights for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def honk_and_flash(self, vehicle_id: str, duration_seconds: Optional[int] = None) -> dict[str, Any]:
@@ -267,10 +267,10 @@ class CommandMixin:
             
             vehicle.controls.commands.commands["honk-and-flash"].value = command_dict
             self.invalidate_cache()
-            logger.info(f"Honk and flash executed for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Honk and flash executed for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Honk and flash executed"}
         except Exception as e:
-            logger.error(f"Failed to honk and flash for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to honk and flash for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def start_window_heating(self, vehicle_id: str) -> dict[str, Any]:
@@ -295,10 +295,10 @@ class CommandMixin:
         try:
             vehicle.window_heating.commands.commands["start-stop"].value = WindowHeatingStartStopCommand.Command.START
             self.invalidate_cache()
-            logger.info(f"Window heating started for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Window heating started for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Window heating started"}
         except Exception as e:
-            logger.error(f"Failed to start window heating for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to start window heating for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
 
     def stop_window_heating(self, vehicle_id: str) -> dict[str, Any]:
@@ -323,8 +323,8 @@ class CommandMixin:
         try:
             vehicle.window_heating.commands.commands["start-stop"].value = WindowHeatingStartStopCommand.Command.STOP
             self.invalidate_cache()
-            logger.info(f"Window heating stopped for vehicle {vehicle_id}, cache invalidated")
+            logger.info("Window heating stopped for vehicle %s, cache invalidated", vehicle_id)
             return {"success": True, "message": "Window heating stopped"}
         except Exception as e:
-            logger.error(f"Failed to stop window heating for vehicle {vehicle_id}: {e}")
+            logger.error("Failed to stop window heating for vehicle %s: %s", vehicle_id, e)
             return {"success": False, "error": str(e)}
@@ -116,21 +116,7 @@ def test_stop_charging_electric_vehicle(adapter):
 
 # ==================== MCP SERVER REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_start_charging_tool_is_registered(mcp_server):
-    """Test that start_charging tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "start_charging" in tool_names, "start_charging tool should be registered in MCP server"
-
-
-@pytest.mark.asyncio
-async def test_stop_charging_tool_is_registered(mcp_server):
-    """Test that stop_charging tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "stop_charging" in tool_names, "stop_charging tool should be registered in MCP server"
+@pytest.mark.parametrize("tool", ["start_charging", "stop_charging"])
+def test_charging_tools_are_registered(mcp_tool_names, tool):
+    """Test that start and stop charging are exposed as MCP tools"""
+    assert tool in mcp_tool_names, f"{tool} tool should be registered in MCP server"
@@ -120,21 +120,7 @@ def test_start_climatization_combustion_vehicle(adapter):
 
 # ==================== MCP SERVER REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_start_climatization_tool_is_registered(mcp_server):
-    """Test that start_climatization tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "start_climatization" in tool_names, "start_climatization tool should be registered in MCP server"
-
-
-@pytest.mark.asyncio
-async def test_stop_climatization_tool_is_registered(mcp_server):
-    """Test that stop_climatization tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "stop_climatization" in tool_names, "stop_climatization tool should be registered in MCP server"
+@pytest.mark.parametrize("tool", ["start_climatization", "stop_climatization"])
+def test_climatization_tools_are_registered(mcp_tool_names, tool):
+    """Test that climate control can be started and stopped via registered tools"""
+    assert tool in mcp_tool_names, f"{tool} tool should be registered in MCP server"
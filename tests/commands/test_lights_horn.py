@@ -147,21 +147,7 @@ def test_honk_and_flash_combustion_vehicle(adapter):
 
 # ==================== MCP SERVER REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_flash_lights_tool_is_registered(mcp_server):
-    """Test that flash_lights tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "flash_lights" in tool_names, "flash_lights tool should be registered in MCP server"
-
-
-@pytest.mark.asyncio
-async def test_honk_and_flash_tool_is_registered(mcp_server):
-    """Test that honk_and_flash tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "honk_and_flash" in tool_names, "honk_and_flash tool should be registered in MCP server"
+@pytest.mark.parametrize("tool", ["flash_lights", "honk_and_flash"])
+def test_lights_horn_tools_are_registered(mcp_tool_names, tool):
+    """Test that flashing lights and honking are available as MCP tools"""
+    assert tool in mcp_tool_names, f"{tool} tool should be registered in MCP server"
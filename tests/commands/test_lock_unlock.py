@@ -128,21 +128,7 @@ def test_unlock_combustion_vehicle(adapter):
 
 # ==================== MCP SERVER REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_lock_vehicle_tool_is_registered(mcp_server):
-    """Test that lock_vehicle tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "lock_vehicle" in tool_names, "lock_vehicle tool should be registered in MCP server"
-
-
-@pytest.mark.asyncio
-async def test_unlock_vehicle_tool_is_registered(mcp_server):
-    """Test that unlock_vehicle tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "unlock_vehicle" in tool_names, "unlock_vehicle tool should be registered in MCP server"
+@pytest.mark.parametrize("tool", ["lock_vehicle", "unlock_vehicle"])
+def test_lock_unlock_tools_are_registered(mcp_tool_names, tool):
+    """Test that locking and unlocking are registered in the MCP server"""
+    assert tool in mcp_tool_names, f"{tool} tool should be registered in MCP server"
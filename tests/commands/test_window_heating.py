@@ -128,21 +128,7 @@ def test_stop_window_heating_combustion_vehicle(adapter):
 
 # ==================== MCP SERVER REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_start_window_heating_tool_is_registered(mcp_server):
-    """Test that start_window_heating tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "start_window_heating" in tool_names, "start_window_heating tool should be registered in MCP server"
-
-
-@pytest.mark.asyncio
-async def test_stop_window_heating_tool_is_registered(mcp_server):
-    """Test that stop_window_heating tool is registered in the MCP server"""
-    tools = await mcp_server.get_tools()
-    
-    assert tools is not None, "Tools should not be None"
-    tool_names = list(tools.keys())
-    assert "stop_window_heating" in tool_names, "stop_window_heating tool should be registered in MCP server"
+@pytest.mark.parametrize("tool", ["start_window_heating", "stop_window_heating"])
+def test_window_heating_tools_are_registered(mcp_tool_names, tool):
+    """Test that window heating can be switched on and off via registered tools"""
+    assert tool in mcp_tool_names, f"{tool} tool should be registered in MCP server"
@@ -8,16 +8,21 @@ in the tests/ directory and subdirectories via pytest's conftest.py mechanism.
 Fixtures provided:
 
 Mock Data Fixtures (for unit/integration tests):
-- adapter: TestAdapter instance with 2 mock vehicles (module-scoped)
-- mcp_server: FastMCP server with TestAdapter (module-scoped)
-- mcp_client: Connected MCP client for async testing (function-scoped)
+- adapter: TestAdapter instance with 2 mock vehicles (session-scoped)
+- mcp_server: FastMCP server with TestAdapter (session-scoped)
+- mcp_registry: Tool names and resource template URIs, read concurrently (session-scoped)
+- mcp_tool_names: Names of all registered MCP tools (session-scoped)
+- mcp_resource_template_uris: URIs of all registered resource templates (session-scoped)
+- mcp_client: Connected MCP client for async testing (module-scoped)
+- fresh_mcp_client: Dedicated MCP client for tests that need isolation (function-scoped)
 
 Real API Fixtures (for end-to-end tests):
-- config_path: Path to VW account credentials (src/config.json)
-- tokenstore_file: Path to OAuth token cache (tmp/tokenstore)
-- real_adapter: CarConnectivityAdapter connected to real VW API (module-scoped)
-- real_mcp_server: FastMCP server with real adapter running in background (module-scoped)
-- real_mcp_client: MCP client connected to real server (function-scoped)
+- config_path: Path to VW account credentials (src/config.json, session-scoped)
+- tokenstore_file: Path to OAuth token cache (tmp/tokenstore, persisted in ~/.cache/vw_connect_mcp, session-scoped)
+- real_adapter: CarConnectivityAdapter connected to real VW API (session-scoped)
+- real_mcp_server: FastMCP server with real adapter, in-process transport (session-scoped)
+- real_mcp_client_stdio: MCP client talking to the real server subprocess over stdio (session-scoped)
+- real_mcp_client: MCP client connected to real server (module-scoped)
 
 Usage:
 Tests can simply declare these fixtures as function parameters:
@@ -50,16 +55,24 @@ Benefits:
 Architecture:
 - Mock fixtures use TestAdapter for fast, deterministic tests
 - Real fixtures use CarConnectivityAdapter for integration tests
-- Module-scoped fixtures for expensive resources (adapters, servers)
-- Function-scoped clients for test isolation
+- Session-scoped mock adapter and server (stateless, built once per run)
+- Session-scoped real API fixtures so VW login and server start happen once per run
+- Module-scoped mock client (read-only calls share one MCP session); fresh_mcp_client for isolation
 """
 import pytest
+import pytest_asyncio
+import os
 import sys
+import shutil
 import asyncio
+import hashlib
 import logging
 from pathlib import Path
 from fastmcp import Client
-from collections.abc import AsyncIterator
+from fastmcp.client.transports import StdioTransport
+from mcp.shared.exceptions import McpError
+from filelock import FileLock
+from collections.abc import AsyncIterator, Iterator
 
 # Add tests directory to Python path for imports
 tests_dir = Path(__file__).parent
@@ -70,16 +83,34 @@ from weconnect_mcp.server.mcp_server import get_server
 from weconnect_mcp.adapter.carconnectivity_adapter import CarConnectivityAdapter
 
 logger = logging.getLogger(__name__)
-logger = logging.getLogger(__name__)
+
+
+# ==================== TIMEOUT BUDGETS ====================
+
+# pytest-timeout budgets (seconds) applied to tests marked quick or live:
+# quick = in-process MCP calls (fail fast), live = calls hitting the real VW API.
+# Every other test falls back to the timeout set in pytest.ini. pytest-timeout's
+# signal method also covers fixture setup/teardown, async ones included.
+TIMEOUT_BUDGETS = {"quick": 2, "live": 15}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Translate the quick/live markers into pytest-timeout markers."""
+    for item in items:
+        for marker_name, seconds in TIMEOUT_BUDGETS.items():
+            if item.get_closest_marker(marker_name):
+                item.add_marker(pytest.mark.timeout(seconds))
 
 
 # ==================== MOCK DATA FIXTURES ====================
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def adapter():
     """Provide a TestAdapter instance with 2 mock vehicles for testing.
     
-    Module-scoped: Created once per test module and reused across all tests.
+    Session-scoped: Created once per test run and shared by all modules.
+    TestAdapter is stateless (commands do not change its data), so sharing
+    it cannot leak state between tests.
     
     Available for all tests in:
     - tools/
@@ -95,11 +126,12 @@ def adapter():
     return TestAdapter()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def mcp_server(adapter):
     """Provide a FastMCP server instance with all tools, commands, and resources registered.
     
-    Module-scoped: Created once per test module and reused across all tests.
+    Session-scoped: Built once per test run, so tool and resource
+    registration happens a single time instead of once per test module.
     
     Uses the adapter fixture to create a fully configured MCP server.
     
@@ -119,11 +151,53 @@ def mcp_server(adapter):
     return get_server(adapter)
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_registry(mcp_server):
+    """Read the tool and resource template registries of the mock MCP server.
+    
+    Session-scoped: Both registries are read once, concurrently, and shared
+    by every *_registered test through mcp_tool_names and
+    mcp_resource_template_uris.
+    
+    Returns:
+        Tuple of (tool names, resource template URIs) as frozen sets
+    """
+    tools, resource_templates = await asyncio.gather(
+        mcp_server.get_tools(),
+        mcp_server.get_resource_templates(),
+    )
+    assert tools is not None, "Tools should not be None"
+    assert resource_templates is not None, "Resource templates should not be None"
+    return frozenset(tools.keys()), frozenset(resource_templates.keys())
+
+
+@pytest.fixture(scope="session")
+def mcp_tool_names(mcp_registry):
+    """Provide the names of all tools registered on the mock MCP server.
+    
+    Returns:
+        Frozen set of registered tool names (read-only, shared by all tests)
+    """
+    return mcp_registry[0]
+
+
+@pytest.fixture(scope="session")
+def mcp_resource_template_uris(mcp_registry):
+    """Provide the URIs of all resource templates registered on the mock MCP server.
+    
+    Returns:
+        Frozen set of registered resource template URIs (read-only, shared by all tests)
+    """
+    return mcp_registry[1]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
 async def mcp_client(mcp_server):
     """Provide a connected MCP client for async resource/tool access testing.
     
-    Function-scoped: Fresh client per test to avoid state pollution.
+    Module-scoped: One client (and one MCP initialize handshake) per test
+    module. TestAdapter is stateless, so tests sharing the session cannot
+    pollute each other; use fresh_mcp_client when a test needs its own.
     Automatically connects and disconnects via async context manager.
     
     Available for:
@@ -138,7 +212,6 @@ async def mcp_client(mcp_server):
         Connected MCP Client instance
     
     Usage:
-        @pytest.mark.asyncio
         async def test_example(mcp_client):
             result = await mcp_client.read_resource("data://list_vehicles")
     """
@@ -146,9 +219,23 @@ async def mcp_client(mcp_server):
         yield client
 
 
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def fresh_mcp_client(mcp_server):
+    """Provide a dedicated MCP client that is connected for a single test.
+    
+    Function-scoped: Use instead of mcp_client for tests that exercise the
+    connection itself or would leave state behind in a shared session.
+    
+    Yields:
+        Connected MCP Client instance
+    """
+    async with Client(mcp_server) as client:
+        yield client
+
+
 # ==================== REAL API FIXTURES ====================
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def config_path() -> Path:
     """Provide path to VW account credentials configuration.
     
@@ -167,8 +254,8 @@ def config_path() -> Path:
     return (current_dir / "../src/config.json").resolve()
 
 
-@pytest.fixture(scope="module")
-def tokenstore_file() -> Path:
+@pytest.fixture(scope="session")
+def tokenstore_file(config_path: Path) -> Iterator[Path]:
     """Provide path to OAuth token cache file.
     
     Returns path to tokenstore file for caching VW API OAuth tokens.
@@ -176,22 +263,61 @@ def tokenstore_file() -> Path:
     
     Located at: ../tmp/tokenstore (relative to tests directory)
     
+    The tokenstore is also persisted in ~/.cache/vw_connect_mcp/<config hash>, keyed
+    by the contents of config.json. At session start a newer cached copy is
+    restored into tmp/, and at session end the current tokenstore is saved
+    back, so fresh checkouts and CI runs with a warm cache skip the OAuth login.
+    The cache directory is created with mode 0o700 and the copy with 0o600.
+    
     Used by:
     - test_carconnectivity_adapter.py
     - test_full_roundtrip.py
     """
     current_dir = Path(__file__).resolve().parent
-    return (current_dir / "../tmp/tokenstore").resolve()
+    tokenstore = (current_dir / "../tmp/tokenstore").resolve()
+    if not config_path.is_file():
+        yield tokenstore
+        return
+
+    config_hash = hashlib.sha256(config_path.read_bytes()).hexdigest()[:16]
+    cached = Path.home() / ".cache" / "vw_connect_mcp" / config_hash
+    tokenstore_lock = FileLock(f"{tokenstore}.lock")
+
+    tokenstore.parent.mkdir(parents=True, exist_ok=True)
+    with tokenstore_lock:
+        if cached.is_file() and (
+            not tokenstore.exists() or cached.stat().st_mtime > tokenstore.stat().st_mtime
+        ):
+            shutil.copy2(cached, tokenstore)
+            logger.debug("Restored tokenstore from %s", cached)
 
+    yield tokenstore
 
-@pytest.fixture(scope="module")
+    if tokenstore.is_file():
+        # OAuth tokens grant account access: keep the cache private to the user.
+        # The copy is created 0o600 up front so it is never readable by others.
+        cached.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(cached.parent, 0o700)
+        with tokenstore_lock:
+            fd = os.open(cached, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.fchmod(fd, 0o600)  # an existing copy keeps its old mode otherwise
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(tokenstore.read_bytes())
+            stat = tokenstore.stat()
+            os.utime(cached, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        logger.debug("Saved tokenstore to %s", cached)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def real_adapter(
     config_path: Path,
     tokenstore_file: Path,
 ) -> AsyncIterator[CarConnectivityAdapter]:
     """Provide a CarConnectivityAdapter connected to real VW API.
     
-    Module-scoped: Logs in once per test session, reuses connection.
+    Session-scoped: Logs in once per pytest run, reuses connection across
+    all test modules. Runs on the session event loop so that setup and
+    teardown (at session end) happen on the same loop.
     
     Lifecycle:
     1. Reads credentials from config_path
@@ -199,6 +325,9 @@ async def real_adapter(
     3. Yields authenticated adapter to tests
     4. Automatically disconnects on teardown
     
+    Login runs under a file lock next to the tokenstore, so parallel
+    pytest-xdist workers do not refresh the OAuth token concurrently.
+    
     Used by:
     - test_carconnectivity_adapter.py
     - test_full_roundtrip.py (via real_mcp_server)
@@ -207,61 +336,107 @@ async def real_adapter(
         Authenticated CarConnectivityAdapter instance
     """
     logger.debug("1/7 Entering real_adapter fixture")
-    async with CarConnectivityAdapter(
-        config_path.as_posix(),
-        tokenstore_file.as_posix(),
-    ) as adapter_instance:
+    tokenstore_file.parent.mkdir(parents=True, exist_ok=True)
+    tokenstore_lock = FileLock(f"{tokenstore_file}.lock")
+    # The adapter logs in (and may refresh the token) on construction
+    with tokenstore_lock:
+        adapter_instance = CarConnectivityAdapter(
+            config_path.as_posix(),
+            tokenstore_file.as_posix(),
+        )
+    try:
         yield adapter_instance
+    finally:
+        with tokenstore_lock:
+            adapter_instance.shutdown()
     logger.debug("7/7 Exiting real_adapter fixture")
 
 
-@pytest.fixture(scope="module")
-async def real_mcp_server(config_path: Path, real_adapter: CarConnectivityAdapter):
-    """Provide a FastMCP server running with real CarConnectivityAdapter.
+@pytest.fixture(scope="session")
+def real_mcp_server(real_adapter: CarConnectivityAdapter):
+    """Provide a FastMCP server with real CarConnectivityAdapter.
     
-    Module-scoped: Server is created once and runs in background for all tests.
+    Session-scoped: Server is created once and shared by all tests.
     
-    Lifecycle:
-    1. Creates server with real VW API adapter
-    2. Starts server in background asyncio task
-    3. Runs stdio transport for MCP protocol
-    4. Yields server to tests
-    5. Cancels task and waits for clean shutdown
+    Clients connect with Client(server), which uses FastMCP's in-process
+    transport: requests are dispatched directly to the server without
+    stdio pipes or JSON framing, and no background task or warm-up is needed.
+    Use real_mcp_client_stdio for tests that must exercise the stdio transport.
     
     Used by:
     - test_full_roundtrip.py
-    
-    Note: Server runs continuously; clients connect/disconnect per test.
     """
     logger.debug("2/7 Entering real_mcp_server fixture")
-    server = get_server(real_adapter)
-    finished = asyncio.Event()
+    return get_server(real_adapter)
 
-    async def run_and_signal():
-        try:
-            await server.run_stdio_async(show_banner=False)
-        finally:
-            finished.set()
 
-    task = asyncio.create_task(run_and_signal())
-    await asyncio.sleep(1)  # Give server time to start
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def real_mcp_client_stdio(config_path: Path, tokenstore_file: Path) -> AsyncIterator[Client]:
+    """Provide an MCP client connected to the real server over the stdio transport.
+    
+    Session-scoped: The server is started once as a subprocess
+    (weconnect_mcp.cli.mcp_server_cli --transport stdio) and talked to through
+    its stdin/stdout pipes, exactly like an MCP host would.
+    Only for protocol-conformance tests marked with @pytest.mark.stdio;
+    everything else should use real_mcp_client (in-process transport).
+    
+    Lifecycle:
+    1. Spawns the stdio server with config_path and tokenstore_file
+    2. Waits for the MCP initialize handshake; the server only answers once
+       its VW login is done (bounded by the live timeout budget)
+    3. Checks that the server answers a ping over stdio (readiness probe)
+    4. Yields the connected client to tests
+    5. Closing the client terminates the subprocess
+    
+    Raises:
+        RuntimeError: If the server does not complete the handshake or ping
+    """
+    logger.debug("2/7 Entering real_mcp_client_stdio fixture")
+    pythonpath = [str(tests_dir.parent / "src")]
+    if os.environ.get("PYTHONPATH"):
+        pythonpath.append(os.environ["PYTHONPATH"])
+    transport = StdioTransport(
+        command=sys.executable,
+        args=[
+            "-m", "weconnect_mcp.cli.mcp_server_cli", config_path.as_posix(),
+            "--transport", "stdio",
+            "--tokenstorefile", tokenstore_file.as_posix(),
+        ],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(pythonpath)},
+        keep_alive=False,
+    )
+    client = Client(transport, init_timeout=TIMEOUT_BUDGETS["live"])
+    # The subprocess logs in (and may refresh the token) before it answers the
+    # handshake. Wait for the lock in a worker thread so the shared session
+    # loop keeps running; thread_local=False lets the loop thread release it.
+    tokenstore_lock = FileLock(f"{tokenstore_file}.lock", thread_local=False)
+    await asyncio.to_thread(tokenstore_lock.acquire)
+    connected = False
     try:
-        yield server
+        async with client:
+            connected = True
+            tokenstore_lock.release()
+            if not await client.ping():
+                raise RuntimeError("stdio MCP server did not answer ping after the handshake")
+            yield client
+    except (McpError, RuntimeError) as e:
+        if connected:
+            raise
+        raise RuntimeError(f"stdio MCP server did not complete the initialize handshake: {e}") from e
     finally:
-        logger.debug("5/7 Exiting real_mcp_server fixture - start")
-        task.cancel()
-        await finished.wait()
-        logger.debug("6/7 Exiting real_mcp_server fixture")
+        tokenstore_lock.release()  # no-op once released after the handshake
+        logger.debug("6/7 Exiting real_mcp_client_stdio fixture")
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
 async def real_mcp_client(real_mcp_server):
     """Provide a connected MCP client for testing server communication with real API.
     
-    Function-scoped: Fresh client per test to ensure isolated test state.
+    Module-scoped: One client (and one MCP initialize handshake) per test
+    module. The real API tests only read data, so reconnecting per test
+    buys no isolation.
     
     Uses async context manager for automatic connection and disconnection.
-    Each test gets a new client connected to the long-running server.
     
     Used by:
     - test_full_roundtrip.py
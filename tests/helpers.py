@@ -0,0 +1,35 @@
+"""
+Shared Assertion Helpers
+========================
+
+Plain helper functions used by several test modules. They live here rather
+than in conftest.py because conftest is loaded by pytest's plugin manager;
+importing it as a regular module creates a second copy of it.
+
+Usage:
+    from helpers import assert_all_set, assert_mcp_text
+    assert_all_set(status.doors, "front_left", "front_right")
+    assert_mcp_text(result, f"vehicle {vin}")
+"""
+
+
+def assert_all_set(obj, *attrs):
+    """Assert that all given attributes of obj are not None.
+
+    Reports every missing attribute in one failure message instead of
+    stopping at the first one.
+    """
+    missing = [a for a in attrs if getattr(obj, a) is None]
+    assert not missing, f"unset: {missing}"
+
+
+def assert_mcp_text(result, label="result"):
+    """Assert that an MCP read_resource() result holds exactly one text item.
+
+    Args:
+        result: List of contents returned by the MCP client
+        label: Name used in failure messages (e.g. "vehicle <vin>")
+    """
+    assert result is not None, f"{label} should not be None"
+    assert len(result) == 1, f"Expected 1 item in {label}, got {len(result)}"
+    assert isinstance(getattr(result[0], "text", None), str), f"{label}[0].text should be a string"
@@ -14,12 +14,49 @@ Usage:
 """
 import pytest
 import json
+import orjson
+import asyncio
+from typing import Any, NamedTuple
+import pytest_asyncio
+from helpers import assert_mcp_text
 
 import logging
 logger = logging.getLogger(__name__)
 
-# Mark all tests in this file as real_api and slow
-pytestmark = [pytest.mark.real_api, pytest.mark.slow]
+# Mark all tests in this file as real_api and slow. The live budget applies
+# to every test here: the real VW reads happen in the resource_cache fixture,
+# and pytest-timeout counts fixture setup towards the test that triggers it.
+pytestmark = [pytest.mark.real_api, pytest.mark.slow, pytest.mark.live]
+
+
+class CachedResource(NamedTuple):
+    """MCP resource read result together with its decoded JSON payload."""
+    contents: list
+    data: Any
+
+
+# ==================== FIXTURES ====================
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def resource_cache(real_mcp_client) -> dict[str, CachedResource]:
+    """Read the vehicle list and every vehicle state once per module.
+
+    Each resource hits the real VW API, so the MCP responses are fetched a
+    single time and shared by all tests in this module.
+
+    Returns:
+        Dict keyed by resource URI with the raw contents and decoded JSON
+    """
+    cache: dict[str, CachedResource] = {}
+    result = await real_mcp_client.read_resource("data://vehicles")
+    cache["data://vehicles"] = CachedResource(result, orjson.loads(result[0].text))
+
+    # Vehicle states are independent - read them concurrently
+    uris = [f"data://vehicle/{v['vin']}/state" for v in cache["data://vehicles"].data]
+    results = await asyncio.gather(*(real_mcp_client.read_resource(uri) for uri in uris))
+    for uri, result in zip(uris, results):
+        cache[uri] = CachedResource(result, orjson.loads(result[0].text))
+    return cache
 
 
 # ==================== TESTS ====================
@@ -41,34 +78,20 @@ def test_config_json_is_valid(config_path):
     assert isinstance(data, dict), "Config JSON should be a dictionary at the top level"
 
 
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_list_vehicles(real_mcp_client):
+async def test_mcp_list_vehicles(resource_cache):
     """ Tests that the MCP client can list vehicles via the server. """
-    result = await real_mcp_client.read_resource("data://vehicles")
-    logger.debug(f"Resource read: {result}")
-    assert result is not None, "Result from read_resource should not be None"
-    assert result.__len__() == 1, f"Expected 1 result, got {result.__len__()}"
-    assert hasattr(result[0], "text"), "Result[0] should have attribute 'text'"
-    assert isinstance(result[0].text, str), "Result[0].text should be a string"
-
-    all_vehicles_str = result[0].text
-    vehicles = json.loads(all_vehicles_str)
-    logger.debug(f"Found vehicles: {vehicles}")
+    result, vehicles = resource_cache["data://vehicles"]
+    logger.debug("Resource read: %s", result)
+    assert_mcp_text(result)
+    logger.debug("Found vehicles: %s", vehicles)
 
     # vehicles are now dicts with vin, name, model
     for vehicle_info in vehicles:
         assert isinstance(vehicle_info, dict), f"vehicle_info should be a dict, got {type(vehicle_info)}"
         assert "vin" in vehicle_info, "vehicle_info should have a 'vin' key"
         vin = vehicle_info["vin"]
-        logger.debug(f"Reading details for vehicle: {vin}")
-
-        result = await real_mcp_client.read_resource(f"data://vehicle/{vin}/state")
-        assert result is not None, f"Result for vehicle {vin} should not be None"
-        assert result.__len__() == 1, f"Expected 1 result for vehicle {vin}, got {result.__len__()}"
-        assert hasattr(result[0], "text"), f"Result[0] for vehicle {vin} should have attribute 'text'"
-        assert isinstance(result[0].text, str), f"Result[0].text for vehicle {vin} should be a string"
+        logger.debug("Reading details for vehicle: %s", vin)
 
-        vehicle_str = result[0].text
-        returned_vehicle = json.loads(vehicle_str)
-        logger.debug(f"Vehicle details: {returned_vehicle}")
\ No newline at end of file
+        result, returned_vehicle = resource_cache[f"data://vehicle/{vin}/state"]
+        assert_mcp_text(result, f"result for vehicle {vin}")
+        logger.debug("Vehicle details: %s", returned_vehicle)
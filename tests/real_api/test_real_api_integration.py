@@ -15,7 +15,6 @@ import json
 pytestmark = [pytest.mark.real_api, pytest.mark.slow]
 
 
-@pytest.mark.asyncio
 async def test_mcp_server_with_real_api(real_adapter):
     """Test MCP server tools with real VW API - simulates AI assistant workflow."""
     from weconnect_mcp.server.mcp_server import get_server
@@ -93,7 +92,6 @@ async def test_mcp_server_with_real_api(real_adapter):
 
 
 
-@pytest.mark.asyncio
 async def test_mcp_tools_return_valid_json(real_adapter):
     """Verify all MCP tools return JSON-serializable data (required by MCP protocol)."""
     print("\n" + "="*60)
@@ -137,7 +135,6 @@ async def test_mcp_tools_return_valid_json(real_adapter):
 
 
 
-@pytest.mark.asyncio
 async def test_mcp_command_error_handling(real_adapter):
     """Test command methods handle errors gracefully for invalid vehicle IDs.
     
@@ -164,7 +161,6 @@ async def test_mcp_command_error_handling(real_adapter):
     print("="*60)
 
 
-@pytest.mark.asyncio
 async def test_mcp_server_handles_none_values(real_adapter):
     """Test MCP server gracefully handles None values from VW API.
     
@@ -13,7 +13,6 @@ import pytest
 pytestmark = [pytest.mark.real_api, pytest.mark.slow]
 
 
-@pytest.mark.asyncio
 async def test_license_plate_availability_from_real_api(real_adapter):
     """Verify VW API does NOT provide license plate information (known limitation)."""
     vehicles = real_adapter.list_vehicles()
@@ -46,7 +45,6 @@ async def test_license_plate_availability_from_real_api(real_adapter):
 
 
 
-@pytest.mark.asyncio
 async def test_license_plate_field_exists_but_is_none(real_adapter):
     """Verify license_plate field exists but is None."""
     vehicles = real_adapter.list_vehicles()
@@ -58,7 +56,6 @@ async def test_license_plate_field_exists_but_is_none(real_adapter):
         print(f"✅ Vehicle {vehicle.vin}: license_plate = None (as expected)")
 
 
-@pytest.mark.asyncio
 async def test_adapter_layer_handles_missing_license_plate(real_adapter):
     """Verify adapter correctly handles missing license plate data."""
     vehicles = real_adapter.list_vehicles()
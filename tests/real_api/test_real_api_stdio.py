@@ -0,0 +1,40 @@
+"""stdio Transport Tests with Real VW API.
+
+Protocol-conformance tests that talk to the MCP server the way an MCP host
+does: the server runs as a subprocess (weconnect_mcp.cli.mcp_server_cli
+--transport stdio) and every request goes through its stdin/stdout pipes.
+
+⚠️ Requires valid VW credentials in src/config.json and internet connection.
+
+Usage:
+    pytest tests/real_api/test_real_api_stdio.py -v  # Run with real API
+    pytest tests/ -m "not stdio"  # Skip stdio transport tests
+"""
+import pytest
+import orjson
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Real API over a spawned stdio server; the live budget also covers the
+# subprocess start and VW login in the real_mcp_client_stdio fixture
+pytestmark = [pytest.mark.real_api, pytest.mark.slow, pytest.mark.stdio, pytest.mark.live]
+
+
+async def test_stdio_lists_tools(real_mcp_client_stdio):
+    """Test that the tool list is served over the stdio transport."""
+    tools = await real_mcp_client_stdio.list_tools()
+    tool_names = {tool.name for tool in tools}
+    logger.debug("Tools over stdio: %s", sorted(tool_names))
+    assert "get_vehicles" in tool_names, "get_vehicles should be listed over stdio"
+
+
+async def test_stdio_get_vehicles(real_mcp_client_stdio):
+    """Test that a tool call round-trips through the stdio pipes with a JSON result."""
+    result = await real_mcp_client_stdio.call_tool("get_vehicles", {})
+    vehicles = orjson.loads(result.content[0].text)
+    logger.debug("Vehicles over stdio: %s", vehicles)
+
+    assert isinstance(vehicles, list), "get_vehicles should return a list"
+    for vehicle in vehicles:
+        assert "vin" in vehicle, f"vehicle {vehicle} should have a 'vin' key"
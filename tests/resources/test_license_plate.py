@@ -9,6 +9,7 @@ Note:
 """
 import pytest
 from src.weconnect_mcp.adapter.abstract_adapter import VehicleDetailLevel
+from test_data import EXPECTED_VEHICLE_COUNT
 
 pytestmark = pytest.mark.mcp_resources
 
@@ -46,7 +47,7 @@ def test_list_vehicles_returns_license_plate(adapter):
     """Test that list_vehicles() returns license_plate."""
     vehicles = adapter.list_vehicles()
     
-    assert len(vehicles) == 2
+    assert len(vehicles) == EXPECTED_VEHICLE_COUNT
     
     # Check first vehicle
     assert vehicles[0].license_plate is not None
@@ -25,7 +25,9 @@ Note:
     (see test.sh --skip-slow and pytest.ini).
 """
 import pytest
-import json
+import pytest_asyncio
+import orjson
+import asyncio
 from test_data import (
     VIN_ELECTRIC,
     VIN_COMBUSTION,
@@ -44,28 +46,28 @@ logger = logging.getLogger(__name__)
 pytestmark = pytest.mark.mcp_resources
 
 
+# ==================== FIXTURES ====================
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def state_resource_template(mcp_server):
+    """Look up the data://vehicle/{vehicle_id}/state template once per module."""
+    template = await mcp_server.get_resource_template("data://vehicle/{vehicle_id}/state")
+    assert template is not None, "Resource template should not be None"
+    return template
+
+
 # ==================== TESTS - RESOURCE REGISTRATION ====================
 
-@pytest.mark.asyncio
-async def test_vehicle_state_resource_template_is_registered(mcp_server):
+def test_vehicle_state_resource_template_is_registered(mcp_resource_template_uris):
     """Test that data://vehicle/{vehicle_id}/state resource template is registered"""
-    all_resource_templates = await mcp_server.get_resource_templates()
-    
-    assert all_resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(all_resource_templates.keys())
-    logger.debug(f"Registered resource templates: {template_uris}")
-    assert "data://vehicle/{vehicle_id}/state" in template_uris, "data://vehicle/{vehicle_id}/state template should be registered"
+    logger.debug("Registered resource templates: %s", sorted(mcp_resource_template_uris))
+    assert "data://vehicle/{vehicle_id}/state" in mcp_resource_template_uris, "data://vehicle/{vehicle_id}/state template should be registered"
 
 
 # ==================== TESTS - RESOURCE DATA RETRIEVAL ====================
 
-@pytest.mark.asyncio
-async def test_vehicle_state_resource_by_vin(mcp_server):
+async def test_vehicle_state_resource_by_vin(state_resource_template):
     """Test that resource template returns data for valid VIN"""
-    state_resource_template = await mcp_server.get_resource_template("data://vehicle/{vehicle_id}/state")
-    
-    assert state_resource_template is not None, "Resource template should not be None"
-    
     # Read state for electric vehicle by VIN
     vehicle_state_json = await state_resource_template.read({"vehicle_id": VIN_ELECTRIC})
     
@@ -77,11 +79,10 @@ async def test_vehicle_state_resource_by_vin(mcp_server):
     assert vehicle_state.vin == VIN_ELECTRIC
 
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_via_client_by_vin(mcp_client):
     """Test that MCP client can read vehicle state by VIN"""
     result = await mcp_client.read_resource(f"data://vehicle/{VIN_ELECTRIC}/state")
-    logger.debug(f"Client resource read result: {result}")
+    logger.debug("Client resource read result: %s", result)
     
     assert result is not None, "Result should not be None"
     assert len(result) == 1, f"Expected 1 result, got {len(result)}"
@@ -92,10 +93,9 @@ async def test_vehicle_state_resource_via_client_by_vin(mcp_client):
     vehicle = VehicleModel.model_validate_json(vehicle_str)
     
     assert vehicle.vin == VIN_ELECTRIC
-    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE["name"]
+    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE.name
 
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_via_client_by_name(mcp_client):
     """Test that MCP client can read vehicle state by name"""
     result = await mcp_client.read_resource(f"data://vehicle/{NAME_ELECTRIC}/state")
@@ -107,7 +107,6 @@ async def test_vehicle_state_resource_via_client_by_name(mcp_client):
     assert vehicle.name == NAME_ELECTRIC
 
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_via_client_by_license_plate(mcp_client):
     """Test that MCP client can read vehicle state by license plate"""
     result = await mcp_client.read_resource(f"data://vehicle/{LICENSE_PLATE_ELECTRIC}/state")
@@ -120,7 +119,6 @@ async def test_vehicle_state_resource_via_client_by_license_plate(mcp_client):
 
 
 @pytest.mark.parametrize("identifier", get_electric_vehicle_identifiers())
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_all_identifiers(mcp_client, identifier):
     """Test that resource works with VIN, name, or license plate"""
     result = await mcp_client.read_resource(f"data://vehicle/{identifier}/state")
@@ -132,35 +130,33 @@ async def test_vehicle_state_resource_all_identifiers(mcp_client, identifier):
 
 # ==================== TESTS - DATA STRUCTURE ====================
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_electric_vehicle_fields(mcp_client):
     """Test that electric vehicle state has all expected fields"""
     result = await mcp_client.read_resource(f"data://vehicle/{VIN_ELECTRIC}/state")
     vehicle = VehicleModel.model_validate_json(result[0].text)
     
     # Basic fields
-    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE["vin"]
-    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE["name"]
-    assert vehicle.model == EXPECTED_ELECTRIC_VEHICLE["model"]
-    assert vehicle.manufacturer == EXPECTED_ELECTRIC_VEHICLE["manufacturer"]
-    assert vehicle.type == EXPECTED_ELECTRIC_VEHICLE["type"]
+    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE.vin
+    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE.name
+    assert vehicle.model == EXPECTED_ELECTRIC_VEHICLE.model
+    assert vehicle.manufacturer == EXPECTED_ELECTRIC_VEHICLE.manufacturer
+    assert vehicle.type == EXPECTED_ELECTRIC_VEHICLE.type
     
     # State should be present
     assert vehicle.state is not None
     assert vehicle.connection_state is not None
 
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_combustion_vehicle_fields(mcp_client):
     """Test that combustion vehicle state has all expected fields"""
     result = await mcp_client.read_resource(f"data://vehicle/{VIN_COMBUSTION}/state")
     vehicle = VehicleModel.model_validate_json(result[0].text)
     
     # Basic fields
-    assert vehicle.vin == EXPECTED_COMBUSTION_VEHICLE["vin"]
-    assert vehicle.name == EXPECTED_COMBUSTION_VEHICLE["name"]
-    assert vehicle.model == EXPECTED_COMBUSTION_VEHICLE["model"]
-    assert vehicle.type == EXPECTED_COMBUSTION_VEHICLE["type"]
+    assert vehicle.vin == EXPECTED_COMBUSTION_VEHICLE.vin
+    assert vehicle.name == EXPECTED_COMBUSTION_VEHICLE.name
+    assert vehicle.model == EXPECTED_COMBUSTION_VEHICLE.model
+    assert vehicle.type == EXPECTED_COMBUSTION_VEHICLE.type
 
 
 # ==================== TESTS - BOTH VEHICLE TYPES ====================
@@ -169,21 +165,19 @@ async def test_vehicle_state_resource_combustion_vehicle_fields(mcp_client):
     (VIN_ELECTRIC, EXPECTED_ELECTRIC_VEHICLE),
     (VIN_COMBUSTION, EXPECTED_COMBUSTION_VEHICLE),
 ])
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_both_vehicles(mcp_client, vin, expected):
     """Test that resource returns correct data for both vehicle types"""
     result = await mcp_client.read_resource(f"data://vehicle/{vin}/state")
     vehicle = VehicleModel.model_validate_json(result[0].text)
     
-    assert vehicle.vin == expected["vin"]
-    assert vehicle.name == expected["name"]
-    assert vehicle.model == expected["model"]
-    assert vehicle.type == expected["type"]
+    assert vehicle.vin == expected.vin
+    assert vehicle.name == expected.name
+    assert vehicle.model == expected.model
+    assert vehicle.type == expected.type
 
 
 # ==================== TESTS - DATA CONSISTENCY ====================
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_matches_adapter(adapter, mcp_client):
     """Test that resource data matches adapter get_vehicle() output"""
     # Get data from adapter
@@ -197,15 +191,15 @@ async def test_vehicle_state_resource_matches_adapter(adapter, mcp_client):
     assert resource_vehicle == adapter_vehicle, "Resource data should match adapter data"
 
 
-@pytest.mark.asyncio
 async def test_vehicle_state_resource_matches_adapter_for_both_vehicles(adapter, mcp_client):
     """Test that resource matches adapter for both test vehicles"""
-    for vin in [VIN_ELECTRIC, VIN_COMBUSTION]:
+    vins = [VIN_ELECTRIC, VIN_COMBUSTION]
+    # Read both resources concurrently
+    results = await asyncio.gather(*(mcp_client.read_resource(f"data://vehicle/{vin}/state") for vin in vins))
+    
+    for vin, result in zip(vins, results):
         # Get data from adapter
         adapter_vehicle = adapter.get_vehicle(vin)
-        
-        # Get data from resource
-        result = await mcp_client.read_resource(f"data://vehicle/{vin}/state")
         resource_vehicle = VehicleModel.model_validate_json(result[0].text)
         
         # Compare
@@ -214,11 +208,8 @@ async def test_vehicle_state_resource_matches_adapter_for_both_vehicles(adapter,
 
 # ==================== TESTS - ERROR HANDLING ====================
 
-@pytest.mark.asyncio
-async def test_vehicle_state_resource_invalid_vehicle_returns_none(mcp_server):
+async def test_vehicle_state_resource_invalid_vehicle_returns_none(state_resource_template):
     """Test that resource returns error JSON for non-existent vehicle"""
-    state_resource_template = await mcp_server.get_resource_template("data://vehicle/{vehicle_id}/state")
-    
     vehicle_state = await state_resource_template.read({"vehicle_id": VIN_INVALID})
     
     # Should return JSON error for non-existent vehicle
@@ -226,7 +217,6 @@ async def test_vehicle_state_resource_invalid_vehicle_returns_none(mcp_server):
     assert isinstance(vehicle_state, str), "Should return JSON string"
     
     # Parse JSON and check for error
-    import json
-    result = json.loads(vehicle_state)
+    result = orjson.loads(vehicle_state)
     assert "error" in result, "Should contain error message"
     assert VIN_INVALID in result["error"], "Error should mention the invalid VIN"
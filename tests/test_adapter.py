@@ -393,3 +393,8 @@ class TestAdapter(AbstractAdapter):
         if not any(v.vin == vin for v in self.vehicles):
             return {"success": False, "error": f"Vehicle {vehicle_id} not found"}
         return {"success": True, "message": "Window heating stopped"}
+
+
+# Mock vehicles as an immutable module-level tuple, so tests can iterate or
+# parametrize over them without going through the TestAdapter class
+VEHICLES = tuple(TestAdapter.vehicles)
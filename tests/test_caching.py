@@ -9,13 +9,11 @@ real CarConnectivityAdapter (for actual caching behavior).
 
 import pytest
 import time
-import sys
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from src.weconnect_mcp.adapter.carconnectivity_adapter import CarConnectivityAdapter, CACHE_DURATION_SECONDS
 
-sys.path.insert(0, 'tests')
-from test_adapter import TestAdapter
+from test_data import EXPECTED_VEHICLE_COUNT
 
 
 # ==================== CACHE DURATION TESTS ====================
@@ -35,10 +33,8 @@ def test_cache_invalidation_method_exists_on_abstract():
     assert hasattr(AbstractAdapter, 'invalidate_cache'), "AbstractAdapter should have invalidate_cache method"
 
 
-def test_cache_invalidation_on_test_adapter():
+def test_cache_invalidation_on_test_adapter(adapter):
     """Test that TestAdapter has invalidate_cache method."""
-    adapter = TestAdapter()
-    
     # Verify method exists
     assert hasattr(adapter, 'invalidate_cache'), "Adapter should have invalidate_cache method"
     assert callable(adapter.invalidate_cache), "invalidate_cache should be callable"
@@ -47,13 +43,11 @@ def test_cache_invalidation_on_test_adapter():
     adapter.invalidate_cache()
 
 
-def test_cache_invalidation_workflow():
+def test_cache_invalidation_workflow(adapter):
     """Test the complete cache invalidation workflow with TestAdapter."""
-    adapter = TestAdapter()
-    
     # 1. Read data (should work normally)
     vehicles = adapter.list_vehicles()
-    assert len(vehicles) == 2, "Should have 2 test vehicles"
+    assert len(vehicles) == EXPECTED_VEHICLE_COUNT, "Should have 2 test vehicles"
     
     # 2. Execute a command (should invalidate cache)
     result = adapter.lock_vehicle("WVWZZZED4SE003938")
@@ -64,7 +58,7 @@ def test_cache_invalidation_workflow():
     
     # 4. Read data again (should fetch fresh data)
     vehicles_after = adapter.list_vehicles()
-    assert len(vehicles_after) == 2, "Should still have 2 test vehicles after cache invalidation"
+    assert len(vehicles_after) == EXPECTED_VEHICLE_COUNT, "Should still have 2 test vehicles after cache invalidation"
 
 
 # ==================== CACHE BEHAVIOR TESTS (Real Adapter) ====================
@@ -12,9 +12,9 @@ Purpose:
 - Helper functions for parametrized tests
 
 Contents:
-1. Vehicle Identifiers (VINs, names, license plates)
+1. Vehicle Identifiers (VINs, names, license plates, vehicle count)
 2. Expected Values for Each Tool/Method
-   - Vehicle info (electric & combustion)
+   - Vehicle info (electric & combustion, as ExpectedVehicle named tuples)
    - Physical status (doors, windows, tyres, lights)
    - Energy status (battery, tank, range, charging)
    - Climate status (climatization, window heating)
@@ -31,6 +31,8 @@ Test Data Overview:
 
 All expected values match TestAdapter mock data exactly to ensure test accuracy.
 """
+import functools
+from typing import NamedTuple
 
 # ==================== VEHICLE IDs ====================
 
@@ -48,28 +50,41 @@ LICENSE_PLATE_COMBUSTION = "M-AB 1234"  # Updated to match TestAdapter
 VIN_INVALID = "INVALID_VIN"
 VIN_NONEXISTENT = "NONEXISTENT"
 
+# Number of mock vehicles in TestAdapter (ID.7 + T7)
+EXPECTED_VEHICLE_COUNT = 2
+
 
 # ==================== EXPECTED VALUES ====================
 
+class ExpectedVehicle(NamedTuple):
+    """Expected vehicle info; read-only, with attribute access (e.g. .vin)."""
+    vin: str
+    name: str
+    model: str
+    manufacturer: str
+    type: str
+    license_plate: str
+
+
 # Vehicle Info - Electric (ID.7)
-EXPECTED_ELECTRIC_VEHICLE = {
-    "vin": VIN_ELECTRIC,
-    "name": NAME_ELECTRIC,
-    "model": "ID.7 Tourer",  # Updated to match TestAdapter
-    "manufacturer": "Volkswagen",
-    "type": "electric",
-    "license_plate": LICENSE_PLATE_ELECTRIC,
-}
+EXPECTED_ELECTRIC_VEHICLE = ExpectedVehicle(
+    vin=VIN_ELECTRIC,
+    name=NAME_ELECTRIC,
+    model="ID.7 Tourer",  # Updated to match TestAdapter
+    manufacturer="Volkswagen",
+    type="electric",
+    license_plate=LICENSE_PLATE_ELECTRIC,
+)
 
 # Vehicle Info - Combustion (T7)
-EXPECTED_COMBUSTION_VEHICLE = {
-    "vin": VIN_COMBUSTION,
-    "name": NAME_COMBUSTION,
-    "model": "Transporter 7",  # Updated to match TestAdapter
-    "manufacturer": "Volkswagen",
-    "type": "combustion",
-    "license_plate": LICENSE_PLATE_COMBUSTION,
-}
+EXPECTED_COMBUSTION_VEHICLE = ExpectedVehicle(
+    vin=VIN_COMBUSTION,
+    name=NAME_COMBUSTION,
+    model="Transporter 7",  # Updated to match TestAdapter
+    manufacturer="Volkswagen",
+    type="combustion",
+    license_plate=LICENSE_PLATE_COMBUSTION,
+)
 
 # Physical Status
 EXPECTED_PHYSICAL_STATUS_ID7 = {
@@ -91,6 +106,8 @@ EXPECTED_ENERGY_ELECTRIC = {
     "total_range_km": 312.0,  # Updated to match TestAdapter
     "electric_range_km": 312.0,
     "is_charging": True,  # Updated: vehicle is charging in TestAdapter
+    "charging_power_kw": 11.0,
+    "target_soc_percent": 90,
 }
 
 # Energy Status - Combustion
@@ -106,6 +123,7 @@ EXPECTED_CLIMATE_ELECTRIC = {
     "climatization_state": "heating",
     "is_active": True,
     "target_temperature_celsius": 22.0,
+    "window_heating_front": "on",
     "window_heating_rear": "on",
 }
 
@@ -114,6 +132,7 @@ EXPECTED_CLIMATE_COMBUSTION = {
     "climatization_state": "off",
     "is_active": False,
     "target_temperature_celsius": 21.0,
+    "window_heating_front": "off",
     "window_heating_rear": "off",
 }
 
@@ -150,21 +169,28 @@ EXPECTED_POSITION_COMBUSTION = {
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Cached and returned as tuples: the identifiers never change, so every
+# parametrize list and loop shares one immutable object
+
+@functools.cache
 def get_electric_vehicle_identifiers():
     """Return all valid identifiers for the electric test vehicle."""
-    return [VIN_ELECTRIC, NAME_ELECTRIC, LICENSE_PLATE_ELECTRIC]
+    return (VIN_ELECTRIC, NAME_ELECTRIC, LICENSE_PLATE_ELECTRIC)
 
 
+@functools.cache
 def get_combustion_vehicle_identifiers():
     """Return all valid identifiers for the combustion test vehicle."""
-    return [VIN_COMBUSTION, NAME_COMBUSTION, LICENSE_PLATE_COMBUSTION]
+    return (VIN_COMBUSTION, NAME_COMBUSTION, LICENSE_PLATE_COMBUSTION)
 
 
+@functools.cache
 def get_all_valid_identifiers():
     """Return all valid vehicle identifiers."""
     return get_electric_vehicle_identifiers() + get_combustion_vehicle_identifiers()
 
 
+@functools.cache
 def get_invalid_identifiers():
     """Return invalid vehicle identifiers for negative testing."""
-    return [VIN_INVALID, VIN_NONEXISTENT, "", "   "]
+    return (VIN_INVALID, VIN_NONEXISTENT, "", "   ")
@@ -6,194 +6,95 @@ This test suite validates the FastMCP MCP protocol implementation.
 
 What is tested:
 - MCP client connection to server
-- Tool invocation via MCP protocol (call_tool)
-- Tool response validation and JSON parsing
+- Tool invocation via MCP protocol (call_tool), one smoke round trip
+- Tool responses decoded back into the adapter's models
 - Error handling for invalid parameters
 
 Test architecture:
 - Uses TestAdapter for deterministic mock data
-- Module-scoped fixtures for server (created once)
-- Function-scoped fixtures for clients (fresh per test)
-- Async tests with @pytest.mark.asyncio
-- 10-second timeout per test
+- Session-scoped server shared by all test modules (created once per run)
+- Module-scoped client shared by the read-only calls (fresh_mcp_client for connection tests)
+- Async tests run in pytest-asyncio auto mode (see pytest.ini)
+- 2-second timeout per test (module-level pytestmark = pytest.mark.quick)
 
 Fixtures (from conftest.py):
 - adapter: TestAdapter with 2 mock vehicles
 - mcp_server: FastMCP server instance with registered tools
-- mcp_client: Connected MCP client for protocol testing
+- mcp_client: Connected MCP client for protocol testing (shared per module)
+- fresh_mcp_client: Dedicated MCP client for connection tests
 
 Note: 
 - Resource tests are in tests/resources/ (not duplicated here)
-- Tool implementation tests are in tests/tools/ (not duplicated here)
+- Tool implementation tests are in tests/tools/ (not duplicated here); they call the
+  adapter directly, so all value checks there skip the MCP JSON-RPC envelope
 - This file focuses on MCP protocol layer (Client ↔ Server communication)
 """
 import pytest
-import json
+import orjson
+import asyncio
+from test_data import VIN_ELECTRIC
+from test_adapter import VEHICLES
+from pydantic import TypeAdapter
+from weconnect_mcp.adapter.abstract_adapter import VehicleListItem
 from weconnect_mcp.adapter.carconnectivity_adapter import VehicleModel
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Every test here is an in-process MCP call: 2s timeout budget (see conftest.py)
+pytestmark = pytest.mark.quick
+
+
+# Validates get_vehicles payloads straight from JSON text in pydantic-core
+VEHICLE_LIST = TypeAdapter(list[VehicleListItem])
+
+
+def _text(result):
+    """Return the text payload of a call_tool() result."""
+    return result.content[0].text
+
+
+def _load(result):
+    """Decode the JSON text returned by a call_tool() result."""
+    return orjson.loads(_text(result))
+
 
 # ==================== MCP CLIENT CONNECTION TESTS ====================
 
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_client_connects(mcp_client):
+async def test_mcp_client_connects(fresh_mcp_client):
     """ Test that the MCP client can connect to the server. """
-    assert mcp_client.is_connected(), "MCP client should be connected"
+    assert fresh_mcp_client.is_connected(), "MCP client should be connected"
+
+
+# ==================== MCP PROTOCOL SMOKE TESTS ====================
+
+async def test_mcp_protocol_smoke(mcp_client):
+    """Test one get_vehicle_info call_tool round trip through the Client ↔ Server path.
+
+    Only the protocol path is checked here; the returned values are asserted
+    directly against the adapter in tests/tools/.
+    """
+    data = _load(await mcp_client.call_tool("get_vehicle_info", {"vehicle_id": VIN_ELECTRIC}))
+    assert data["vin"] == VIN_ELECTRIC, f"get_vehicle_info returned {data}"
 
 
 # ==================== MCP TOOL INVOCATION TESTS ====================
 
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_climatization_state(mcp_client):
-    """Test that the MCP client can get climatization state via the server."""
-    # Test with ID7 (should have active heating)
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/climate")
-    logger.debug(f"Climatization state result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    climatization = result[0].text
-    logger.debug(f"Climatization data: {climatization}")
-    
-    climatization_dict = json.loads(climatization)
-    assert climatization_dict["state"] == "heating"
-    assert climatization_dict["is_active"] is True
-    assert climatization_dict["target_temperature_celsius"] == 22.0
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_maintenance_info(mcp_client):
-    """Test that the MCP client can get maintenance info via the server."""
-    # Test with T7 (combustion vehicle with oil service)
-    result = await mcp_client.read_resource("data://vehicle/WV2ZZZSTZNH009136/maintenance")
-    logger.debug(f"Maintenance info result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    maintenance = result[0].text
-    logger.debug(f"Maintenance data: {maintenance}")
-    
-    maintenance_dict = json.loads(maintenance)
-    assert maintenance_dict["inspection_due_date"] == "2026-05-20T00:00:00+00:00"
-    assert maintenance_dict["inspection_due_distance_km"] == 12000
-    assert maintenance_dict["oil_service_due_date"] == "2026-04-10T00:00:00+00:00"
-    assert maintenance_dict["oil_service_due_distance_km"] == 8000
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_range_info(mcp_client):
-    """Test that the MCP client can get range info via the server."""
-    # Test with ID7 (electric vehicle)
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/range")
-    logger.debug(f"Range info result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    range_info = result[0].text
-    logger.debug(f"Range data: {range_info}")
-    
-    range_dict = json.loads(range_info)
-    assert range_dict["total_range_km"] == 312.0  # Updated to match test_data.py
-    assert range_dict["electric_range_km"] == 312.0
-    assert range_dict["battery_level_percent"] == 77.0
-    # Combustion fields should not be present for electric vehicle
-    assert "combustion_range_km" not in range_dict
-    assert "tank_level_percent" not in range_dict
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_window_heating_state(mcp_client):
-    """Test that the MCP client can get window heating state via the server."""
-    # Test with ID7 (should have both heaters on)
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/window-heating")
-    logger.debug(f"Window heating result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    window_heating = result[0].text
-    logger.debug(f"Window heating data: {window_heating}")
-    
-    window_heating_dict = json.loads(window_heating)
-    assert window_heating_dict["front"]["state"] == "on"  # Updated to match TestAdapter
-    assert window_heating_dict["rear"]["state"] == "on"
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_lights_state(mcp_client):
-    """Test that the MCP client can get lights state via the server."""
-    # Test with ID7
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/lights")
-    logger.debug(f"Lights result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    lights = result[0].text
-    logger.debug(f"Lights data: {lights}")
-    
-    lights_dict = json.loads(lights)
-    assert lights_dict["left"]["state"] == "ok"  # Updated: state is "ok" (working), not "off"
-    assert lights_dict["right"]["state"] == "ok"
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_position(mcp_client):
-    """Test that the MCP client can get vehicle position via the server."""
-    # Test with ID7 (Munich position)
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/position")
-    logger.debug(f"Position result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    position = result[0].text
-    logger.debug(f"Position data: {position}")
-    
-    position_dict = json.loads(position)
-    assert position_dict["latitude"] == 48.1351
-    assert position_dict["longitude"] == 11.5820
-    assert position_dict["heading"] == 270
-
-
-
-
-@pytest.mark.mcp_resources
-@pytest.mark.asyncio
-@pytest.mark.timeout(10)
-async def test_mcp_get_battery_status(mcp_client):
-    """Test that the MCP client can get battery status via the server."""
-    # Test with ID7 (electric vehicle)
-    result = await mcp_client.read_resource("data://vehicle/WVWZZZED4SE003938/battery")
-    logger.debug(f"Battery status result: {result}")
-    
-    assert result is not None
-    assert len(result) > 0
-    
-    battery = result[0].text
-    logger.debug(f"Battery data: {battery}")
-    
-    battery_dict = json.loads(battery)
-    assert battery_dict["battery_level_percent"] == 77.0
-    assert battery_dict["range_km"] == 312.0  # Updated to match test_data.py
-    assert battery_dict["is_charging"] is True
-    assert battery_dict["charging_power_kw"] == 11.0  # Updated to match TestAdapter
+async def test_mcp_get_vehicles_matches_adapter(mcp_client, adapter):
+    """Test that get_vehicles via the server returns exactly the adapter's vehicle list."""
+    result = await mcp_client.call_tool("get_vehicles", {})
+    assert VEHICLE_LIST.validate_json(_text(result)) == adapter.list_vehicles()
+
+
+async def test_mcp_get_vehicle_state_matches_adapter(mcp_client, adapter, subtests):
+    """Test that get_vehicle_state via the server round-trips the adapter's VehicleModel.
 
+    Both vehicles are checked in one test; subtests keep a failure for one
+    VIN from hiding the result for the other.
+    """
+    results = await asyncio.gather(
+        *(mcp_client.call_tool("get_vehicle_state", {"vehicle_id": vehicle.vin}) for vehicle in VEHICLES)
+    )
+    for vehicle, result in zip(VEHICLES, results):
+        with subtests.test(vin=vehicle.vin):
+            assert VehicleModel.model_validate_json(_text(result)) == adapter.get_vehicle(vehicle.vin)
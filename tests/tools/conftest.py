@@ -0,0 +1,39 @@
+"""
+Fixtures for the Tools Tests
+============================
+
+Per-VIN adapter lookups shared by the tests in tests/tools/ only. The
+adapter fixture itself comes from tests/conftest.py.
+
+Fixtures provided:
+- climate_status: get_climate_status() results keyed by test VIN (session-scoped)
+- energy_status: get_energy_status() results keyed by test VIN (session-scoped)
+"""
+import pytest
+from test_data import VIN_ELECTRIC, VIN_COMBUSTION, VIN_INVALID
+
+
+@pytest.fixture(scope="session")
+def climate_status(adapter):
+    """Provide get_climate_status() results for the test VINs.
+    
+    Session-scoped: TestAdapter data never changes, so each lookup is done
+    once and the tools tests index the result by VIN.
+    
+    Returns:
+        Dict keyed by VIN_ELECTRIC, VIN_COMBUSTION and VIN_INVALID
+    """
+    return {vin: adapter.get_climate_status(vin) for vin in (VIN_ELECTRIC, VIN_COMBUSTION, VIN_INVALID)}
+
+
+@pytest.fixture(scope="session")
+def energy_status(adapter):
+    """Provide get_energy_status() results for the test VINs.
+    
+    Session-scoped: TestAdapter data never changes, so each lookup is done
+    once and the tools tests index the result by VIN.
+    
+    Returns:
+        Dict keyed by VIN_ELECTRIC, VIN_COMBUSTION and VIN_INVALID
+    """
+    return {vin: adapter.get_energy_status(vin) for vin in (VIN_ELECTRIC, VIN_COMBUSTION, VIN_INVALID)}
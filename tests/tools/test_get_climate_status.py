@@ -38,35 +38,36 @@ from test_data import (
 
 # ==================== TESTS - ELECTRIC VEHICLE (ACTIVE HEATING) ====================
 
-def test_get_climate_status_electric_vehicle(adapter):
+def test_get_climate_status_electric_vehicle(climate_status):
     """Test getting climate status for electric vehicle with active heating"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate is not None
     assert climate.climatization is not None
     assert climate.window_heating is not None
 
 
-def test_climate_status_electric_active_heating(adapter):
+def test_climate_status_electric_active_heating(climate_status):
     """Test that electric vehicle has active heating"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate.climatization.state == EXPECTED_CLIMATE_ELECTRIC["climatization_state"]
     assert climate.climatization.is_active == EXPECTED_CLIMATE_ELECTRIC["is_active"]
     assert climate.climatization.target_temperature_celsius == EXPECTED_CLIMATE_ELECTRIC["target_temperature_celsius"]
 
 
-def test_climate_status_electric_window_heating(adapter):
+def test_climate_status_electric_window_heating(climate_status):
     """Test electric vehicle window heating status"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate.window_heating is not None
+    assert climate.window_heating.front.state == EXPECTED_CLIMATE_ELECTRIC["window_heating_front"]
     assert climate.window_heating.rear.state == EXPECTED_CLIMATE_ELECTRIC["window_heating_rear"]
 
 
-def test_climate_status_electric_estimated_time(adapter):
+def test_climate_status_electric_estimated_time(climate_status):
     """Test that active heating has estimated time remaining"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     if climate.climatization.is_active:
         # When active, should have estimated time
@@ -76,34 +77,35 @@ def test_climate_status_electric_estimated_time(adapter):
 
 # ==================== TESTS - COMBUSTION VEHICLE (OFF) ====================
 
-def test_get_climate_status_combustion_vehicle(adapter):
+def test_get_climate_status_combustion_vehicle(climate_status):
     """Test getting climate status for combustion vehicle (off)"""
-    climate = adapter.get_climate_status(VIN_COMBUSTION)
+    climate = climate_status[VIN_COMBUSTION]
     
     assert climate is not None
     assert climate.climatization is not None
     assert climate.window_heating is not None
 
 
-def test_climate_status_combustion_off(adapter):
+def test_climate_status_combustion_off(climate_status):
     """Test that combustion vehicle climatization is off"""
-    climate = adapter.get_climate_status(VIN_COMBUSTION)
+    climate = climate_status[VIN_COMBUSTION]
     
     assert climate.climatization.state == EXPECTED_CLIMATE_COMBUSTION["climatization_state"]
     assert climate.climatization.is_active == EXPECTED_CLIMATE_COMBUSTION["is_active"]
     assert climate.climatization.target_temperature_celsius == EXPECTED_CLIMATE_COMBUSTION["target_temperature_celsius"]
 
 
-def test_climate_status_combustion_window_heating_off(adapter):
+def test_climate_status_combustion_window_heating_off(climate_status):
     """Test that combustion vehicle window heating is off"""
-    climate = adapter.get_climate_status(VIN_COMBUSTION)
+    climate = climate_status[VIN_COMBUSTION]
     
+    assert climate.window_heating.front.state == EXPECTED_CLIMATE_COMBUSTION["window_heating_front"]
     assert climate.window_heating.rear.state == EXPECTED_CLIMATE_COMBUSTION["window_heating_rear"]
 
 
-def test_climate_status_combustion_no_estimated_time_when_off(adapter):
+def test_climate_status_combustion_no_estimated_time_when_off(climate_status):
     """Test that inactive climatization has no estimated time"""
-    climate = adapter.get_climate_status(VIN_COMBUSTION)
+    climate = climate_status[VIN_COMBUSTION]
     
     if not climate.climatization.is_active:
         # When inactive, estimated time should be None
@@ -112,10 +114,10 @@ def test_climate_status_combustion_no_estimated_time_when_off(adapter):
 
 # ==================== TESTS - CLIMATIZATION STATES ====================
 
-def test_climate_status_state_is_valid(adapter):
+def test_climate_status_state_is_valid(climate_status):
     """Test that climatization state is one of valid values"""
-    electric_climate = adapter.get_climate_status(VIN_ELECTRIC)
-    combustion_climate = adapter.get_climate_status(VIN_COMBUSTION)
+    electric_climate = climate_status[VIN_ELECTRIC]
+    combustion_climate = climate_status[VIN_COMBUSTION]
     
     valid_states = ["off", "heating", "cooling", "ventilation"]
     
@@ -123,10 +125,10 @@ def test_climate_status_state_is_valid(adapter):
     assert combustion_climate.climatization.state in valid_states
 
 
-def test_climate_status_active_state_consistency(adapter):
+def test_climate_status_active_state_consistency(climate_status):
     """Test that is_active matches state (off = not active)"""
-    electric_climate = adapter.get_climate_status(VIN_ELECTRIC)
-    combustion_climate = adapter.get_climate_status(VIN_COMBUSTION)
+    electric_climate = climate_status[VIN_ELECTRIC]
+    combustion_climate = climate_status[VIN_COMBUSTION]
     
     # If state is "off", is_active should be False
     if electric_climate.climatization.state == "off":
@@ -138,10 +140,10 @@ def test_climate_status_active_state_consistency(adapter):
 
 # ==================== TESTS - TEMPERATURE ====================
 
-def test_climate_status_temperature_in_realistic_range(adapter):
+def test_climate_status_temperature_in_realistic_range(climate_status):
     """Test that target temperature is in realistic range"""
-    electric_climate = adapter.get_climate_status(VIN_ELECTRIC)
-    combustion_climate = adapter.get_climate_status(VIN_COMBUSTION)
+    electric_climate = climate_status[VIN_ELECTRIC]
+    combustion_climate = climate_status[VIN_COMBUSTION]
     
     # Realistic cabin temperature: 15-30°C
     assert 15 <= electric_climate.climatization.target_temperature_celsius <= 30
@@ -150,17 +152,17 @@ def test_climate_status_temperature_in_realistic_range(adapter):
 
 # ==================== TESTS - WINDOW HEATING ====================
 
-def test_climate_status_window_heating_has_front_and_rear(adapter):
+def test_climate_status_window_heating_has_front_and_rear(climate_status):
     """Test that window heating has both front and rear"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate.window_heating.front is not None
     assert climate.window_heating.rear is not None
 
 
-def test_climate_status_window_heating_state_is_valid(adapter):
+def test_climate_status_window_heating_state_is_valid(climate_status):
     """Test that window heating state is valid"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     valid_states = ["on", "off"]
     
@@ -170,27 +172,27 @@ def test_climate_status_window_heating_state_is_valid(adapter):
 
 # ==================== TESTS - INVALID VEHICLE ====================
 
-def test_get_climate_status_invalid_vehicle(adapter):
+def test_get_climate_status_invalid_vehicle(climate_status):
     """Test that invalid vehicle returns None"""
-    climate = adapter.get_climate_status(VIN_INVALID)
+    climate = climate_status[VIN_INVALID]
     
     assert climate is None
 
 
 # ==================== TESTS - DATA COMPLETENESS ====================
 
-def test_climate_status_has_all_climatization_fields(adapter):
+def test_climate_status_has_all_climatization_fields(climate_status):
     """Test that climatization has all expected fields"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate.climatization.state is not None
     assert climate.climatization.is_active is not None
     assert climate.climatization.target_temperature_celsius is not None
 
 
-def test_climate_status_has_all_window_heating_fields(adapter):
+def test_climate_status_has_all_window_heating_fields(climate_status):
     """Test that window heating has all expected fields"""
-    climate = adapter.get_climate_status(VIN_ELECTRIC)
+    climate = climate_status[VIN_ELECTRIC]
     
     assert climate.window_heating.front is not None
     assert climate.window_heating.rear is not None
@@ -200,10 +202,10 @@ def test_climate_status_has_all_window_heating_fields(adapter):
 
 # ==================== TESTS - COMPARE VEHICLES ====================
 
-def test_climate_status_different_between_vehicles(adapter):
+def test_climate_status_different_between_vehicles(climate_status):
     """Test that climate status differs between electric and combustion"""
-    electric_climate = adapter.get_climate_status(VIN_ELECTRIC)
-    combustion_climate = adapter.get_climate_status(VIN_COMBUSTION)
+    electric_climate = climate_status[VIN_ELECTRIC]
+    combustion_climate = climate_status[VIN_COMBUSTION]
     
     # Electric has heating active, combustion is off
     assert electric_climate.climatization.is_active != combustion_climate.climatization.is_active
@@ -212,15 +214,10 @@ def test_climate_status_different_between_vehicles(adapter):
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_climate_status_resource_are_registered(mcp_server):
-    """Test that climate status resources are registered in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    
-    # Check that the climate-related resources are registered
-    # (these are the current MCP resources that provide climate status)
-    assert "data://vehicle/{vehicle_id}/climate" in template_uris, "data://vehicle/{vehicle_id}/climate resource should be registered"
-    assert "data://vehicle/{vehicle_id}/window-heating" in template_uris, "data://vehicle/{vehicle_id}/window-heating resource should be registered"
+@pytest.mark.parametrize("uri", [
+    "data://vehicle/{vehicle_id}/climate",
+    "data://vehicle/{vehicle_id}/window-heating",
+])
+def test_get_climate_status_resource_are_registered(mcp_resource_template_uris, uri):
+    """Test that climatization and window heating are exposed as resources"""
+    assert uri in mcp_resource_template_uris, f"{uri} resource should be registered"
@@ -36,9 +36,9 @@ from test_data import (
 
 # ==================== TESTS - ELECTRIC VEHICLE ====================
 
-def test_get_energy_status_electric_vehicle(adapter):
+def test_get_energy_status_electric_vehicle(energy_status):
     """Test getting energy status for electric vehicle"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     assert energy is not None
     assert energy.vehicle_type == "electric"
@@ -46,18 +46,18 @@ def test_get_energy_status_electric_vehicle(adapter):
     assert energy.combustion is None
 
 
-def test_energy_status_electric_battery_level(adapter):
+def test_energy_status_electric_battery_level(energy_status):
     """Test electric vehicle battery level"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     assert energy.electric is not None
     assert energy.electric.battery_level_percent == EXPECTED_ENERGY_ELECTRIC["battery_level_percent"]
     assert 0 <= energy.electric.battery_level_percent <= 100
 
 
-def test_energy_status_electric_range(adapter):
+def test_energy_status_electric_range(energy_status):
     """Test electric vehicle range information"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     assert energy.range is not None
     assert energy.range.total_km == EXPECTED_ENERGY_ELECTRIC["total_range_km"]
@@ -65,9 +65,9 @@ def test_energy_status_electric_range(adapter):
     assert energy.range.combustion_km is None or energy.range.combustion_km == 0
 
 
-def test_energy_status_electric_charging(adapter):
+def test_energy_status_electric_charging(energy_status):
     """Test electric vehicle charging information"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     assert energy.electric is not None
     assert energy.electric.charging is not None
@@ -77,9 +77,9 @@ def test_energy_status_electric_charging(adapter):
 
 # ==================== TESTS - COMBUSTION VEHICLE ====================
 
-def test_get_energy_status_combustion_vehicle(adapter):
+def test_get_energy_status_combustion_vehicle(energy_status):
     """Test getting energy status for combustion vehicle"""
-    energy = adapter.get_energy_status(VIN_COMBUSTION)
+    energy = energy_status[VIN_COMBUSTION]
     
     assert energy is not None
     assert energy.vehicle_type == "combustion"
@@ -87,18 +87,18 @@ def test_get_energy_status_combustion_vehicle(adapter):
     assert energy.combustion is not None
 
 
-def test_energy_status_combustion_tank_level(adapter):
+def test_energy_status_combustion_tank_level(energy_status):
     """Test combustion vehicle fuel tank level"""
-    energy = adapter.get_energy_status(VIN_COMBUSTION)
+    energy = energy_status[VIN_COMBUSTION]
     
     assert energy.combustion is not None
     assert energy.combustion.tank_level_percent == EXPECTED_ENERGY_COMBUSTION["tank_level_percent"]
     assert 0 <= energy.combustion.tank_level_percent <= 100
 
 
-def test_energy_status_combustion_range(adapter):
+def test_energy_status_combustion_range(energy_status):
     """Test combustion vehicle range information"""
-    energy = adapter.get_energy_status(VIN_COMBUSTION)
+    energy = energy_status[VIN_COMBUSTION]
     
     assert energy.range is not None
     assert energy.range.total_km == EXPECTED_ENERGY_COMBUSTION["total_range_km"]
@@ -106,9 +106,9 @@ def test_energy_status_combustion_range(adapter):
     assert energy.range.electric_km is None or energy.range.electric_km == 0
 
 
-def test_energy_status_combustion_fuel_type(adapter):
+def test_energy_status_combustion_fuel_type(energy_status):
     """Test combustion vehicle fuel type"""
-    energy = adapter.get_energy_status(VIN_COMBUSTION)
+    energy = energy_status[VIN_COMBUSTION]
     
     assert energy.combustion is not None
     # Fuel type should be set for combustion vehicles
@@ -118,10 +118,10 @@ def test_energy_status_combustion_fuel_type(adapter):
 
 # ==================== TESTS - RANGE VALIDITY ====================
 
-def test_energy_status_range_is_positive(adapter):
+def test_energy_status_range_is_positive(energy_status):
     """Test that range values are positive"""
-    electric_energy = adapter.get_energy_status(VIN_ELECTRIC)
-    combustion_energy = adapter.get_energy_status(VIN_COMBUSTION)
+    electric_energy = energy_status[VIN_ELECTRIC]
+    combustion_energy = energy_status[VIN_COMBUSTION]
     
     assert electric_energy.range.total_km > 0
     assert electric_energy.range.electric_km > 0
@@ -130,9 +130,9 @@ def test_energy_status_range_is_positive(adapter):
     assert combustion_energy.range.combustion_km > 0
 
 
-def test_energy_status_range_consistency(adapter):
+def test_energy_status_range_consistency(energy_status):
     """Test that electric range equals total range for BEV"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     # For pure electric vehicles, total range should equal electric range
     assert energy.range.total_km == energy.range.electric_km
@@ -140,9 +140,9 @@ def test_energy_status_range_consistency(adapter):
 
 # ==================== TESTS - CHARGING STATE ====================
 
-def test_energy_status_charging_information(adapter):
+def test_energy_status_charging_information(energy_status):
     """Test charging state and power information"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     # Charging state should be boolean
     assert energy.electric.charging.is_charging in [True, False]
@@ -155,21 +155,30 @@ def test_energy_status_charging_information(adapter):
     # If not charging, power can be None or 0
 
 
+def test_energy_status_electric_charging_values(energy_status):
+    """Test the electric vehicle's charging values (11 kW towards 90%)"""
+    charging = energy_status[VIN_ELECTRIC].electric.charging
+    
+    assert charging.is_charging == EXPECTED_ENERGY_ELECTRIC["is_charging"]
+    assert charging.charging_power_kw == EXPECTED_ENERGY_ELECTRIC["charging_power_kw"]
+    assert charging.target_soc_percent == EXPECTED_ENERGY_ELECTRIC["target_soc_percent"]
+
+
 # ==================== TESTS - INVALID VEHICLE ====================
 
-def test_get_energy_status_invalid_vehicle(adapter):
+def test_get_energy_status_invalid_vehicle(energy_status):
     """Test that invalid vehicle returns None"""
-    energy = adapter.get_energy_status(VIN_INVALID)
+    energy = energy_status[VIN_INVALID]
     
     assert energy is None
 
 
 # ==================== TESTS - VEHICLE TYPE AWARENESS ====================
 
-def test_energy_status_vehicle_type_matches_data(adapter):
+def test_energy_status_vehicle_type_matches_data(energy_status):
     """Test that vehicle_type field matches the actual data returned"""
-    electric_energy = adapter.get_energy_status(VIN_ELECTRIC)
-    combustion_energy = adapter.get_energy_status(VIN_COMBUSTION)
+    electric_energy = energy_status[VIN_ELECTRIC]
+    combustion_energy = energy_status[VIN_COMBUSTION]
     
     # Electric should have electric data only
     assert electric_energy.vehicle_type == "electric"
@@ -184,9 +193,9 @@ def test_energy_status_vehicle_type_matches_data(adapter):
 
 # ==================== TESTS - DATA COMPLETENESS ====================
 
-def test_energy_status_has_complete_electric_data(adapter):
+def test_energy_status_has_complete_electric_data(energy_status):
     """Test that electric vehicle has all expected fields"""
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     assert energy.electric.battery_level_percent is not None
     assert energy.electric.charging is not None
@@ -195,9 +204,9 @@ def test_energy_status_has_complete_electric_data(adapter):
     assert energy.range.electric_km is not None
 
 
-def test_energy_status_has_complete_combustion_data(adapter):
+def test_energy_status_has_complete_combustion_data(energy_status):
     """Test that combustion vehicle has all expected fields"""
-    energy = adapter.get_energy_status(VIN_COMBUSTION)
+    energy = energy_status[VIN_COMBUSTION]
     
     assert energy.combustion.tank_level_percent is not None
     assert energy.combustion.fuel_type is not None
@@ -206,14 +215,14 @@ def test_energy_status_has_complete_combustion_data(adapter):
     assert energy.range.combustion_km is not None
 
 
-def test_energy_status_battery_fallback_from_charging_state(adapter):
+def test_energy_status_battery_fallback_from_charging_state(energy_status):
     """Test that battery level falls back to charging state when drives data is unavailable.
     
     This tests the scenario where vehicle.drives doesn't provide battery level,
     but vehicle.battery (used in charging state) does. This can happen when the
     vehicle is in low-power mode or hasn't communicated with WeConnect servers recently.
     """
-    energy = adapter.get_energy_status(VIN_ELECTRIC)
+    energy = energy_status[VIN_ELECTRIC]
     
     # The battery level should be available from either source
     assert energy.electric is not None
@@ -228,16 +237,11 @@ def test_energy_status_battery_fallback_from_charging_state(adapter):
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_energy_status_resource_are_registered(mcp_server):
-    """Test that energy status resources are registered in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    
-    # Check that the energy-related resources are registered
-    # (these are the current MCP resources that provide energy status)
-    assert "data://vehicle/{vehicle_id}/charging" in template_uris, "data://vehicle/{vehicle_id}/charging resource should be registered"
-    assert "data://vehicle/{vehicle_id}/range" in template_uris, "data://vehicle/{vehicle_id}/range resource should be registered"
-    assert "data://vehicle/{vehicle_id}/battery" in template_uris, "data://vehicle/{vehicle_id}/battery resource should be registered"
+@pytest.mark.parametrize("uri", [
+    "data://vehicle/{vehicle_id}/charging",
+    "data://vehicle/{vehicle_id}/range",
+    "data://vehicle/{vehicle_id}/battery",
+])
+def test_get_energy_status_resource_are_registered(mcp_resource_template_uris, uri):
+    """Test that charging, range and battery data are exposed as resources"""
+    assert uri in mcp_resource_template_uris, f"{uri} resource should be registered"
@@ -27,24 +27,36 @@ Test data:
 - Both electric and combustion vehicles tested
 """
 import pytest
+from helpers import assert_all_set
 from test_data import (
     VIN_ELECTRIC,
     VIN_COMBUSTION,
     VIN_INVALID,
+    EXPECTED_PHYSICAL_STATUS_ID7,
+    EXPECTED_PHYSICAL_STATUS_T7,
 )
 
 
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="module")
+def physical_status_electric(adapter):
+    """All-components physical status of the electric vehicle, fetched once per module.
+
+    Field checks read from this object; the component filtering tests
+    still call get_physical_status() with their own components list.
+    """
+    return adapter.get_physical_status(VIN_ELECTRIC)
+
+
 # ==================== TESTS - ALL COMPONENTS ====================
 
-def test_get_physical_status_all_components_electric(adapter):
+def test_get_physical_status_all_components_electric(physical_status_electric):
     """Test getting all physical components for electric vehicle"""
-    status = adapter.get_physical_status(VIN_ELECTRIC)
+    status = physical_status_electric
     
     assert status is not None
-    assert status.doors is not None
-    assert status.windows is not None
-    assert status.tyres is not None
-    assert status.lights is not None
+    assert_all_set(status, "doors", "windows", "tyres", "lights")
 
 
 def test_get_physical_status_all_components_combustion(adapter):
@@ -52,10 +64,7 @@ def test_get_physical_status_all_components_combustion(adapter):
     status = adapter.get_physical_status(VIN_COMBUSTION)
     
     assert status is not None
-    assert status.doors is not None
-    assert status.windows is not None
-    assert status.tyres is not None
-    assert status.lights is not None
+    assert_all_set(status, "doors", "windows", "tyres", "lights")
 
 
 # ==================== TESTS - COMPONENT FILTERING ====================
@@ -87,28 +96,28 @@ def test_get_physical_status_multiple_components(adapter):
     status = adapter.get_physical_status(VIN_ELECTRIC, components=["doors", "windows"])
     
     assert status is not None
-    assert status.doors is not None
-    assert status.windows is not None
+    assert_all_set(status, "doors", "windows")
     assert status.tyres is None
     assert status.lights is None
 
 
 # ==================== TESTS - DOORS ====================
 
-def test_physical_status_doors_locked(adapter):
+def test_physical_status_doors_locked(physical_status_electric):
     """Test that vehicle doors report correct lock states"""
-    status = adapter.get_physical_status(VIN_ELECTRIC, components=["doors"])
+    status = physical_status_electric
     
     assert status.doors is not None
+    assert_all_set(status.doors, "front_left", "front_right", "rear_left", "rear_right")
     assert status.doors.front_left.locked is True
     assert status.doors.front_right.locked is True
     assert status.doors.rear_left.locked is True
     assert status.doors.rear_right.locked is True
 
 
-def test_physical_status_doors_all_closed(adapter):
+def test_physical_status_doors_all_closed(adapter, physical_status_electric):
     """Test that all doors are closed for both vehicles"""
-    electric_status = adapter.get_physical_status(VIN_ELECTRIC, components=["doors"])
+    electric_status = physical_status_electric
     combustion_status = adapter.get_physical_status(VIN_COMBUSTION, components=["doors"])
     
     # Electric
@@ -120,13 +129,26 @@ def test_physical_status_doors_all_closed(adapter):
     assert combustion_status.doors.front_right.open is False
 
 
+@pytest.mark.parametrize("vin,expected", [
+    (VIN_ELECTRIC, EXPECTED_PHYSICAL_STATUS_ID7),
+    (VIN_COMBUSTION, EXPECTED_PHYSICAL_STATUS_T7),
+], ids=["electric", "combustion"])
+def test_physical_status_doors_overall_state(adapter, vin, expected):
+    """Test the overall lock and open state reported for all doors"""
+    doors = adapter.get_physical_status(vin, components=["doors"]).doors
+    
+    assert doors.lock_state is expected["doors_locked"]
+    assert doors.open_state is (not expected["doors_closed"])
+
+
 # ==================== TESTS - WINDOWS ====================
 
-def test_physical_status_windows_all_closed(adapter):
+def test_physical_status_windows_all_closed(physical_status_electric):
     """Test that all windows are closed"""
-    status = adapter.get_physical_status(VIN_ELECTRIC, components=["windows"])
+    status = physical_status_electric
     
     assert status.windows is not None
+    assert_all_set(status.windows, "front_left", "front_right", "rear_left", "rear_right")
     assert status.windows.front_left.open is False
     assert status.windows.front_right.open is False
     assert status.windows.rear_left.open is False
@@ -135,33 +157,32 @@ def test_physical_status_windows_all_closed(adapter):
 
 # ==================== TESTS - TYRES ====================
 
-def test_physical_status_tyres_have_pressure(adapter):
+def test_physical_status_tyres_have_pressure(physical_status_electric):
     """Test that tyres have pressure readings"""
-    status = adapter.get_physical_status(VIN_ELECTRIC, components=["tyres"])
+    status = physical_status_electric
     
     assert status.tyres is not None
-    assert status.tyres.front_left.pressure is not None
-    assert status.tyres.front_right.pressure is not None
-    assert status.tyres.rear_left.pressure is not None
-    assert status.tyres.rear_right.pressure is not None
+    positions = ("front_left", "front_right", "rear_left", "rear_right")
+    assert_all_set(status.tyres, *positions)
+    missing = [p for p in positions if getattr(status.tyres, p).pressure is None]
+    assert not missing, f"no pressure reading: {missing}"
 
 
-def test_physical_status_tyres_pressure_in_valid_range(adapter):
+def test_physical_status_tyres_pressure_in_valid_range(physical_status_electric):
     """Test that tyre pressures are in realistic range"""
-    status = adapter.get_physical_status(VIN_ELECTRIC, components=["tyres"])
+    status = physical_status_electric
     
     assert status.tyres is not None
     # Realistic pressure range: 1.8 - 3.5 bar
-    for tyre in [status.tyres.front_left, status.tyres.front_right, 
-                 status.tyres.rear_left, status.tyres.rear_right]:
-        assert 1.5 <= tyre.pressure <= 4.0, f"Pressure {tyre.pressure} out of realistic range"
+    tyres = (status.tyres.front_left, status.tyres.front_right, status.tyres.rear_left, status.tyres.rear_right)
+    assert all(1.5 <= tyre.pressure <= 4.0 for tyre in tyres), f"Pressures {[tyre.pressure for tyre in tyres]} out of realistic range"
 
 
 # ==================== TESTS - LIGHTS ====================
 
-def test_physical_status_lights_off_when_parked(adapter):
+def test_physical_status_lights_off_when_parked(physical_status_electric):
     """Test that lights state is reported correctly"""
-    status = adapter.get_physical_status(VIN_ELECTRIC, components=["lights"])
+    status = physical_status_electric
     
     assert status.lights is not None
     # TestAdapter uses 'ok' as the state value
@@ -186,26 +207,18 @@ def test_get_physical_status_empty_components_list(adapter):
     
     # Empty list should be treated same as None (all components)
     assert status is not None
-    assert status.doors is not None
-    assert status.windows is not None
-    assert status.tyres is not None
-    assert status.lights is not None
+    assert_all_set(status, "doors", "windows", "tyres", "lights")
 
 
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_physical_status_resource_are_registered(mcp_server):
-    """Test that physical status resources are registered in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    
-    # Check that the individual component resources are registered
-    # (these are the current MCP resources that provide physical status)
-    assert "data://vehicle/{vehicle_id}/doors" in template_uris, "data://vehicle/{vehicle_id}/doors resource should be registered"
-    assert "data://vehicle/{vehicle_id}/windows" in template_uris, "data://vehicle/{vehicle_id}/windows resource should be registered"
-    assert "data://vehicle/{vehicle_id}/tyres" in template_uris, "data://vehicle/{vehicle_id}/tyres resource should be registered"
-    assert "data://vehicle/{vehicle_id}/lights" in template_uris, "data://vehicle/{vehicle_id}/lights resource should be registered"
+@pytest.mark.parametrize("uri", [
+    "data://vehicle/{vehicle_id}/doors",
+    "data://vehicle/{vehicle_id}/windows",
+    "data://vehicle/{vehicle_id}/tyres",
+    "data://vehicle/{vehicle_id}/lights",
+])
+def test_get_physical_status_resource_are_registered(mcp_resource_template_uris, uri):
+    """Test that each physical component has its own registered resource"""
+    assert uri in mcp_resource_template_uris, f"{uri} resource should be registered"
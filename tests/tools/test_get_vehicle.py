@@ -19,7 +19,7 @@ Key features:
 
 Test data:
 - Uses TestAdapter with 2 mock vehicles
-- Parametrized tests for all identifier types
+- One subtest per identifier type
 """
 import pytest
 from test_data import (
@@ -35,70 +35,89 @@ from test_data import (
 from weconnect_mcp.adapter.abstract_adapter import VehicleDetailLevel
 
 
+def _non_none(model) -> int:
+    """Count the fields of a vehicle model that are set (not None)."""
+    return sum(value is not None for value in vars(model).values())
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="module")
+def vehicle_electric_basic(adapter):
+    """BASIC details of the electric vehicle, fetched once per module."""
+    return adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.BASIC)
+
+
+@pytest.fixture(scope="module")
+def vehicle_electric_full(adapter):
+    """FULL details of the electric vehicle, fetched once per module."""
+    return adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.FULL)
+
+
+@pytest.fixture(scope="module")
+def vehicle_combustion_basic(adapter):
+    """BASIC details of the combustion vehicle, fetched once per module."""
+    return adapter.get_vehicle(VIN_COMBUSTION, details=VehicleDetailLevel.BASIC)
+
+
 # ==================== TESTS - BASIC DETAILS ====================
 
-def test_get_vehicle_basic_details_electric(adapter):
+def test_get_vehicle_basic_details_electric(vehicle_electric_basic):
     """Test getting basic vehicle information for electric vehicle"""
-    vehicle = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.BASIC)
+    vehicle = vehicle_electric_basic
     
     assert vehicle is not None
-    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE["vin"]
-    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE["name"]
-    assert vehicle.model == EXPECTED_ELECTRIC_VEHICLE["model"]
-    assert vehicle.type == EXPECTED_ELECTRIC_VEHICLE["type"]  # Use 'type' not 'vehicle_type'
-    assert vehicle.manufacturer == EXPECTED_ELECTRIC_VEHICLE["manufacturer"]
+    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE.vin
+    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE.name
+    assert vehicle.model == EXPECTED_ELECTRIC_VEHICLE.model
+    assert vehicle.type == EXPECTED_ELECTRIC_VEHICLE.type  # Use 'type' not 'vehicle_type'
+    assert vehicle.manufacturer == EXPECTED_ELECTRIC_VEHICLE.manufacturer
 
 
-def test_get_vehicle_basic_details_combustion(adapter):
+def test_get_vehicle_basic_details_combustion(vehicle_combustion_basic):
     """Test getting basic vehicle information for combustion vehicle"""
-    vehicle = adapter.get_vehicle(VIN_COMBUSTION, details=VehicleDetailLevel.BASIC)
+    vehicle = vehicle_combustion_basic
     
     assert vehicle is not None
-    assert vehicle.vin == EXPECTED_COMBUSTION_VEHICLE["vin"]
-    assert vehicle.name == EXPECTED_COMBUSTION_VEHICLE["name"]
-    assert vehicle.model == EXPECTED_COMBUSTION_VEHICLE["model"]
-    assert vehicle.type == EXPECTED_COMBUSTION_VEHICLE["type"]  # Use 'type' not 'vehicle_type'
+    assert vehicle.vin == EXPECTED_COMBUSTION_VEHICLE.vin
+    assert vehicle.name == EXPECTED_COMBUSTION_VEHICLE.name
+    assert vehicle.model == EXPECTED_COMBUSTION_VEHICLE.model
+    assert vehicle.type == EXPECTED_COMBUSTION_VEHICLE.type  # Use 'type' not 'vehicle_type'
 
 
 # ==================== TESTS - FULL DETAILS ====================
 
-def test_get_vehicle_full_details_electric(adapter):
+def test_get_vehicle_full_details_electric(vehicle_electric_full):
     """Test getting full vehicle information including state and software"""
-    vehicle = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.FULL)
+    vehicle = vehicle_electric_full
     
     assert vehicle is not None
     # Basic fields
-    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE["vin"]
-    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE["name"]
+    assert vehicle.vin == EXPECTED_ELECTRIC_VEHICLE.vin
+    assert vehicle.name == EXPECTED_ELECTRIC_VEHICLE.name
     # Full detail fields
     assert vehicle.state is not None
     assert vehicle.connection_state is not None
     assert vehicle.odometer is not None
 
 
-def test_get_vehicle_full_vs_basic_has_more_fields(adapter):
+def test_get_vehicle_full_vs_basic_has_more_fields(vehicle_electric_basic, vehicle_electric_full):
     """Test that FULL detail level includes fields not in BASIC"""
-    basic = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.BASIC)
-    full = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.FULL)
-    
     # Basic should have fewer non-None fields than Full
-    # Count non-None fields
-    basic_fields = sum(1 for v in basic.__dict__.values() if v is not None)
-    full_fields = sum(1 for v in full.__dict__.values() if v is not None)
-    
-    assert full_fields >= basic_fields, "FULL should have at least as many fields as BASIC"
+    assert _non_none(vehicle_electric_full) >= _non_none(vehicle_electric_basic), "FULL should have at least as many fields as BASIC"
 
 
 # ==================== TESTS - IDENTIFIER RESOLUTION ====================
 
-@pytest.mark.parametrize("identifier", get_electric_vehicle_identifiers())
-def test_get_vehicle_by_different_identifiers(adapter, identifier):
+def test_get_vehicle_by_different_identifiers(adapter, subtests):
     """Test that vehicle can be retrieved by VIN, name, or license plate"""
-    vehicle = adapter.get_vehicle(identifier, details=VehicleDetailLevel.BASIC)
-    
-    assert vehicle is not None
-    assert vehicle.vin == VIN_ELECTRIC
-    assert vehicle.name == NAME_ELECTRIC
+    for identifier in get_electric_vehicle_identifiers():
+        with subtests.test(identifier=identifier):
+            vehicle = adapter.get_vehicle(identifier, details=VehicleDetailLevel.BASIC)
+            
+            assert vehicle is not None
+            assert vehicle.vin == VIN_ELECTRIC
+            assert vehicle.name == NAME_ELECTRIC
 
 
 def test_get_vehicle_invalid_identifier(adapter):
@@ -110,17 +129,17 @@ def test_get_vehicle_invalid_identifier(adapter):
 
 # ==================== TESTS - VEHICLE TYPE ====================
 
-def test_get_vehicle_type_electric(adapter):
+def test_get_vehicle_type_electric(vehicle_electric_basic):
     """Test that electric vehicle type is correctly identified"""
-    vehicle = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.BASIC)
+    vehicle = vehicle_electric_basic
     
     assert vehicle is not None
     assert vehicle.type == "electric"  # Use 'type' not 'vehicle_type'
 
 
-def test_get_vehicle_type_combustion(adapter):
+def test_get_vehicle_type_combustion(vehicle_combustion_basic):
     """Test that combustion vehicle type is correctly identified"""
-    vehicle = adapter.get_vehicle(VIN_COMBUSTION, details=VehicleDetailLevel.BASIC)
+    vehicle = vehicle_combustion_basic
     
     assert vehicle is not None
     assert vehicle.type == "combustion"  # Use 'type' not 'vehicle_type'
@@ -128,9 +147,9 @@ def test_get_vehicle_type_combustion(adapter):
 
 # ==================== TESTS - DATA CONSISTENCY ====================
 
-def test_get_vehicle_vin_matches_request(adapter):
+def test_get_vehicle_vin_matches_request(vehicle_electric_basic):
     """Test that returned VIN matches the requested VIN"""
-    vehicle = adapter.get_vehicle(VIN_ELECTRIC, details=VehicleDetailLevel.BASIC)
+    vehicle = vehicle_electric_basic
     
     assert vehicle is not None
     assert vehicle.vin == VIN_ELECTRIC
@@ -139,11 +158,6 @@ def test_get_vehicle_vin_matches_request(adapter):
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_vehicle_info_resouce_is_registered(mcp_server):
+def test_get_vehicle_info_resouce_is_registered(mcp_resource_template_uris):
     """Test that get_vehicle_info is available as a resource in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    assert "data://vehicle/{vehicle_id}/info" in template_uris, "data://vehicle/{vehicle_id}/info resource should be registered in MCP server"
+    assert "data://vehicle/{vehicle_id}/info" in mcp_resource_template_uris, "data://vehicle/{vehicle_id}/info resource should be registered in MCP server"
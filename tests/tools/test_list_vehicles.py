@@ -22,60 +22,65 @@ from test_data import (
     NAME_COMBUSTION,
     EXPECTED_ELECTRIC_VEHICLE,
     EXPECTED_COMBUSTION_VEHICLE,
+    EXPECTED_VEHICLE_COUNT,
 )
 
 
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="module")
+def vehicle_list(adapter):
+    """Result of adapter.list_vehicles(), fetched once per module."""
+    return adapter.list_vehicles()
+
+
+@pytest.fixture(scope="module")
+def vehicles_by_vin(vehicle_list):
+    """Listed vehicles keyed by VIN."""
+    return {v.vin: v for v in vehicle_list}
+
+
 # ==================== TESTS ====================
 
-def test_list_vehicles_returns_all_vehicles(adapter):
+def test_list_vehicles_returns_all_vehicles(vehicle_list):
     """Test that list_vehicles returns all available vehicles"""
-    vehicles = adapter.list_vehicles()
-    
-    assert vehicles is not None
-    assert len(vehicles) == 2, "Should return exactly 2 test vehicles"
+    assert vehicle_list is not None
+    assert len(vehicle_list) == EXPECTED_VEHICLE_COUNT, "Should return exactly 2 test vehicles"
 
 
-def test_list_vehicles_has_required_fields(adapter):
+def test_list_vehicles_has_required_fields(vehicle_list):
     """Test that each vehicle has all required fields"""
-    vehicles = adapter.list_vehicles()
-    
-    for vehicle in vehicles:
+    for vehicle in vehicle_list:
         assert vehicle.vin is not None
         assert vehicle.name is not None
         assert vehicle.model is not None
         assert vehicle.license_plate is not None
 
 
-def test_list_vehicles_electric_vehicle_data(adapter):
+def test_list_vehicles_electric_vehicle_data(vehicles_by_vin):
     """Test that electric vehicle data is correct (also validates presence in list)"""
-    vehicles = adapter.list_vehicles()
-    
-    electric = next((v for v in vehicles if v.vin == VIN_ELECTRIC), None)
+    electric = vehicles_by_vin.get(VIN_ELECTRIC)
     assert electric is not None, "Electric vehicle should be in list"
-    assert electric.name == EXPECTED_ELECTRIC_VEHICLE["name"]
-    assert electric.model == EXPECTED_ELECTRIC_VEHICLE["model"]
-    assert electric.license_plate == EXPECTED_ELECTRIC_VEHICLE["license_plate"]
+    assert electric.name == EXPECTED_ELECTRIC_VEHICLE.name
+    assert electric.model == EXPECTED_ELECTRIC_VEHICLE.model
+    assert electric.license_plate == EXPECTED_ELECTRIC_VEHICLE.license_plate
 
 
-def test_list_vehicles_combustion_vehicle_data(adapter):
+def test_list_vehicles_combustion_vehicle_data(vehicles_by_vin):
     """Test that combustion vehicle data is correct (also validates presence in list)"""
-    vehicles = adapter.list_vehicles()
-    
-    combustion = next((v for v in vehicles if v.vin == VIN_COMBUSTION), None)
+    combustion = vehicles_by_vin.get(VIN_COMBUSTION)
     assert combustion is not None, "Combustion vehicle should be in list"
-    assert combustion.name == EXPECTED_COMBUSTION_VEHICLE["name"]
-    assert combustion.model == EXPECTED_COMBUSTION_VEHICLE["model"]
-    assert combustion.license_plate == EXPECTED_COMBUSTION_VEHICLE["license_plate"]
+    assert combustion.name == EXPECTED_COMBUSTION_VEHICLE.name
+    assert combustion.model == EXPECTED_COMBUSTION_VEHICLE.model
+    assert combustion.license_plate == EXPECTED_COMBUSTION_VEHICLE.license_plate
 
 
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
 async def test_list_vehicles_resource_is_registered(mcp_server):
     """Test that list_vehicles is available as a resource in the MCP server"""
     resources = await mcp_server.get_resources()
     
     assert resources is not None, "Resources should not be None"
-    resource_uris = list(resources.keys())
-    assert "data://vehicles" in resource_uris, "data://vehicles resource should be registered in MCP server"
+    assert "data://vehicles" in resources, "data://vehicles resource should be registered in MCP server"
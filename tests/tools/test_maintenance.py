@@ -88,11 +88,6 @@ def test_maintenance_info_oil_service_only_combustion(adapter):
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_maintenance_info_resource_is_registered(mcp_server):
+def test_get_maintenance_info_resource_is_registered(mcp_resource_template_uris):
     """Test that get_maintenance_info is available as a resource in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    assert "data://vehicle/{vehicle_id}/maintenance" in template_uris, "data://vehicle/{vehicle_id}/maintenance resource should be registered in MCP server"
+    assert "data://vehicle/{vehicle_id}/maintenance" in mcp_resource_template_uris, "data://vehicle/{vehicle_id}/maintenance resource should be registered in MCP server"
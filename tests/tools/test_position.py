@@ -74,11 +74,6 @@ def test_position_coordinates_valid_ranges(adapter):
 # ==================== MCP SERVER REGISTRATION ====================
 
 @pytest.mark.mcp_resources
-@pytest.mark.asyncio
-async def test_get_position_resource_is_registered(mcp_server):
+def test_get_position_resource_is_registered(mcp_resource_template_uris):
     """Test that get_position is available as a resource in the MCP server"""
-    resource_templates = await mcp_server.get_resource_templates()
-    
-    assert resource_templates is not None, "Resource templates should not be None"
-    template_uris = list(resource_templates.keys())
-    assert "data://vehicle/{vehicle_id}/position" in template_uris, "data://vehicle/{vehicle_id}/position resource should be registered in MCP server"
+    assert "data://vehicle/{vehicle_id}/position" in mcp_resource_template_uris, "data://vehicle/{vehicle_id}/position resource should be registered in MCP server"